@@ -0,0 +1,61 @@
+"""
+Streams a large bookings export the way GET /bookings/export does and checks the process
+stays within an RSS budget. The bookings are generated inside a transaction that is rolled
+back at the end, so the database is left untouched.
+
+Runs against the database configured in .env:
+    python helpers/bench_export.py [bookings] [ndjson|csv] [rss budget MiB]
+"""
+import asyncio
+import resource
+import sys
+import time
+from pathlib import Path
+
+from sqlalchemy import text
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.database import async_session_maker, engine
+from src.utils.db_manager import DBManager
+from src.utils.export import export_chunks
+
+SEED = text("""
+    INSERT INTO bookings (id, room_id, user_id, date_from, date_to, price_per_night)
+    SELECT gen_random_uuid(), :room_id, :user_id, DATE '2050-01-01' + n % 3650, DATE '2050-01-01' + n % 3650 + 3, 100
+    FROM generate_series(1, :count) AS n
+""")
+
+
+def rss_mib() -> float:
+    # ru_maxrss is in KiB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+async def main(count: int = 1_000_000, export_format: str = "ndjson", budget_mib: float = 100):
+    async with DBManager(session_factory=async_session_maker) as db:
+        room_id = (await db.rooms.get_all())[0].id
+        user_id = (await db.users.get_all())[0].id
+        await db.session.execute(SEED, {"room_id": room_id, "user_id": user_id, "count": count})
+
+        rss_before = rss_mib()
+        started = time.perf_counter()
+        exported = 0
+        columns = [column.key for column in db.bookings.columns()]
+        async for chunk in export_chunks(export_format, columns, db.bookings.stream_bookings(user_id=user_id)):
+            exported += len(chunk)
+        elapsed = time.perf_counter() - started
+        growth = rss_mib() - rss_before
+    await engine.dispose()
+
+    print(f"{export_format}: {exported / 2 ** 20:.0f} MiB in {elapsed:.1f}s, peak RSS growth {growth:.1f} MiB")
+    assert growth <= budget_mib, f"RSS grew by {growth:.1f} MiB, budget {budget_mib} MiB"
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    asyncio.run(main(
+        int(args[0]) if args else 1_000_000,
+        args[1] if len(args) > 1 else "ndjson",
+        float(args[2]) if len(args) > 2 else 100,
+    ))
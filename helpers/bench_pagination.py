@@ -0,0 +1,64 @@
+"""
+Compares the old two-statement pagination (count, then page) with BaseRepository.paginate,
+which returns the total and the page in one statement via `count(*) OVER ()`.
+
+Runs against the database configured in .env:
+    python helpers/bench_pagination.py
+"""
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+from sqlalchemy import event, func, select
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.database import async_session_maker, engine
+from src.models.hotels_models import HotelsModel
+from src.schemas.pagination import PaginationParams
+from src.utils.db_manager import DBManager
+
+ITERATIONS = 500
+
+statements = 0
+
+
+def count_statement(*args):
+    global statements
+    statements += 1
+
+
+async def two_round_trips(db, pagination: PaginationParams):
+    total = await db.session.scalar(select(func.count()).select_from(HotelsModel))
+    offset = (pagination.page - 1) * pagination.per_page
+    query = select(HotelsModel).order_by(HotelsModel.id).offset(offset).limit(pagination.per_page)
+    hotels = (await db.session.execute(query)).scalars().all()
+    return hotels, total
+
+
+async def one_round_trip(db, pagination: PaginationParams):
+    return await db.hotels.get_paginated(pagination)
+
+
+async def bench(name, fetch_page):
+    global statements
+    statements = 0
+    pagination = PaginationParams(page=2, per_page=10)
+    async with DBManager(session_factory=async_session_maker) as db:
+        started = time.perf_counter()
+        for _ in range(ITERATIONS):
+            await fetch_page(db, pagination)
+        elapsed = time.perf_counter() - started
+    print(f"{name}: {statements / ITERATIONS:.1f} statements/page, {elapsed / ITERATIONS * 1000:.2f} ms/page")
+
+
+async def main():
+    event.listen(engine.sync_engine, "before_cursor_execute", count_statement)
+    await bench("count + page", two_round_trips)
+    await bench("count(*) OVER ()", one_round_trip)
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,80 @@
+"""
+Per-request CPU time of a 25-hotel page with nested rooms, served the default way
+(response_model re-validation + jsonable_encoder + json.dumps) and through FastJSONResponse
+(pydantic-core straight to bytes). Needs no database:
+    python helpers/bench_serialization.py
+"""
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.schemas.hotels_schemas import HotelsPrintOut, PaginatedHotelsPrintOut
+from src.schemas.rooms_schemas import Room
+from src.utils.responses import FastJSONResponse
+
+REQUESTS = 2000
+
+page = PaginatedHotelsPrintOut(
+    page=1,
+    per_page=25,
+    total_found=1000,
+    hotels=[
+        HotelsPrintOut(
+            id=hotel_id,
+            name=f"Hotel {hotel_id}",
+            location=f"City {hotel_id % 10}, Street {hotel_id}",
+            rooms=[
+                Room(
+                    id=hotel_id * 10 + room_id,
+                    hotel_id=hotel_id,
+                    name=f"Room {room_id}",
+                    description="Double room with a city view, breakfast included",
+                    price_per_night=100 + room_id,
+                    quantity=5,
+                    rooms_left=room_id,
+                )
+                for room_id in range(6)
+            ],
+        )
+        for hotel_id in range(25)
+    ],
+)
+
+app = FastAPI()
+
+
+@app.get("/default", response_model=PaginatedHotelsPrintOut, response_model_exclude_none=True)
+async def default_path():
+    return page
+
+
+@app.get("/fast", response_model=PaginatedHotelsPrintOut)
+async def fast_path():
+    return FastJSONResponse(page, exclude_none=True)
+
+
+async def bench(client: AsyncClient, path: str) -> bytes:
+    body = (await client.get(path)).content
+    started = time.process_time()
+    for _ in range(REQUESTS):
+        await client.get(path)
+    elapsed = time.process_time() - started
+    print(f"{path}: {elapsed / REQUESTS * 1000:.3f} ms CPU/request, {len(body)} bytes")
+    return body
+
+
+async def main():
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+        default_body = await bench(client, "/default")
+        fast_body = await bench(client, "/fast")
+    assert PaginatedHotelsPrintOut.model_validate_json(default_body) == PaginatedHotelsPrintOut.model_validate_json(fast_body)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,42 @@
+"""
+Bulk-loads hotels and rooms from a JSON Lines or CSV catalog, the same way POST /hotels/import does.
+
+Runs against the database configured in .env:
+    python helpers/import_catalog.py catalog.jsonl [--format jsonl|csv] [--batch-size 1000]
+"""
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.database import async_session_maker, engine
+from src.services.catalog_import import CatalogImporter, read_records
+from src.utils.db_manager import DBManager
+
+
+async def main(path: Path, catalog_format: str, batch_size: int):
+    started = time.perf_counter()
+    with path.open(encoding="utf-8", newline="") as lines:
+        async with DBManager(session_factory=async_session_maker) as db:
+            report = await CatalogImporter(db, batch_size=batch_size).run(read_records(lines, catalog_format))
+    await engine.dispose()
+
+    for error in report.errors:
+        print(f"line {error.line}: {error.error}", file=sys.stderr)
+    print(
+        f"{report.rows} rows in {time.perf_counter() - started:.1f}s: "
+        f"{report.hotels_created} hotels and {report.rooms_created} rooms created, {len(report.errors)} rejected"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("path", type=Path)
+    parser.add_argument("--format", choices=["jsonl", "csv"], dest="catalog_format")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+    catalog_format = args.catalog_format or ("csv" if args.path.suffix == ".csv" else "jsonl")
+    asyncio.run(main(args.path, catalog_format, args.batch_size))
@@ -0,0 +1,69 @@
+"""
+Fires many concurrent single bookings at one room type and checks it is never overbooked.
+
+Every booking runs in its own session, like concurrent POST /bookings requests, through
+BookingsRepository.book. Afterwards the peak occupancy is recomputed from the bookings
+table itself (not the ledger) and compared with the room quantity.
+
+Runs against the database configured in .env (creates one hotel and room):
+    python helpers/load_test_bookings.py [bookings] [concurrency] [quantity]
+"""
+import asyncio
+import sys
+import time
+from datetime import date
+from pathlib import Path
+
+from sqlalchemy import select
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.database import async_session_maker, engine
+from src.repo.utils import rooms_peak_occupancy
+from src.schemas.bookings_schemas import Booking
+from src.schemas.hotels_schemas import Hotel
+from src.schemas.rooms_schemas import RoomCreateInternal
+from src.utils.db_manager import DBManager
+
+DATE_FROM, DATE_TO = date(2040, 6, 1), date(2040, 6, 4)
+
+
+async def create_room(quantity: int) -> tuple[int, int]:
+    async with DBManager(session_factory=async_session_maker) as db:
+        user_id = (await db.users.get_all())[0].id
+        hotel_id = await db.hotels.add(Hotel(name="Load Test Hotel", location="Load Test"))
+        room_id = await db.rooms.add(RoomCreateInternal(
+            hotel_id=hotel_id, name="Load Test Room", description="", price_per_night=100, quantity=quantity,
+        ))
+        await db.commit()
+    return user_id, room_id
+
+
+async def book_once(user_id: int, room_id: int, semaphore: asyncio.Semaphore) -> str:
+    async with semaphore, DBManager(session_factory=async_session_maker) as db:
+        [result] = await db.bookings.book(user_id, [Booking(room_id=room_id, date_from=DATE_FROM, date_to=DATE_TO)])
+        await db.commit()
+        return result.status
+
+
+async def main(bookings: int = 2000, concurrency: int = 50, quantity: int = 10):
+    user_id, room_id = await create_room(quantity)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    started = time.perf_counter()
+    statuses = await asyncio.gather(*[book_once(user_id, room_id, semaphore) for _ in range(bookings)])
+    elapsed = time.perf_counter() - started
+
+    async with DBManager(session_factory=async_session_maker) as db:
+        peaks = select(rooms_peak_occupancy(DATE_FROM, DATE_TO))
+        peak = dict((await db.session.execute(peaks)).all()).get(room_id, 0)
+    await engine.dispose()
+
+    created = statuses.count("created")
+    print(f"{bookings} bookings, {concurrency} concurrent: {created} created, {statuses.count('conflict')} conflicts")
+    print(f"{bookings / elapsed:.0f} bookings/s; peak occupancy {peak} of {quantity}")
+    assert created == peak == quantity, "room overbooked" if peak > quantity else "units left unsold"
+
+
+if __name__ == "__main__":
+    asyncio.run(main(*map(int, sys.argv[1:])))
@@ -0,0 +1,79 @@
+"""
+Measures the latency of an unrelated endpoint while a storm of logins runs against the same
+server, to check that password hashing no longer stalls the event loop.
+
+Start the app first (one worker), then:
+    python helpers/load_test_logins.py [base url] [logins] [concurrency] [probe path]
+
+The probe is requested sequentially before and during the storm; with bcrypt on the event
+loop its p99 jumps to several bcrypt rounds, with the hasher pool it stays flat.
+"""
+import asyncio
+import statistics
+import sys
+import time
+import uuid
+
+import httpx
+
+
+def percentiles(samples: list[float]) -> str:
+    cuts = statistics.quantiles(samples, n=100)
+    return f"p50 {cuts[49]:.1f} ms, p99 {cuts[98]:.1f} ms, max {max(samples):.1f} ms"
+
+
+async def probe(client: httpx.AsyncClient, path: str, stop: asyncio.Event) -> list[float]:
+    samples = []
+    while not stop.is_set():
+        started = time.perf_counter()
+        response = await client.get(path)
+        samples.append((time.perf_counter() - started) * 1000)
+        response.raise_for_status()
+        await asyncio.sleep(0.01)
+    return samples
+
+
+async def probe_for(client: httpx.AsyncClient, path: str, seconds: float) -> list[float]:
+    stop = asyncio.Event()
+    probing = asyncio.create_task(probe(client, path, stop))
+    await asyncio.sleep(seconds)
+    stop.set()
+    return await probing
+
+
+async def log_in(client: httpx.AsyncClient, credentials: dict, semaphore: asyncio.Semaphore) -> int:
+    async with semaphore:
+        return (await client.post("/auth/log_in", json=credentials)).status_code
+
+
+async def main(base_url: str = "http://127.0.0.1:8000", logins: int = 200, concurrency: int = 50, path: str = "/metrics"):
+    async with httpx.AsyncClient(base_url=base_url, timeout=60) as client:
+        credentials = {"email": f"load-{uuid.uuid4().hex[:8]}@example.com", "password": "load-test"}
+        (await client.post("/auth/sign_up", json=credentials)).raise_for_status()
+
+        baseline = await probe_for(client, path, 2)
+
+        stop = asyncio.Event()
+        probing = asyncio.create_task(probe(client, path, stop))
+        semaphore = asyncio.Semaphore(concurrency)
+        started = time.perf_counter()
+        statuses = await asyncio.gather(*[log_in(client, credentials, semaphore) for _ in range(logins)])
+        elapsed = time.perf_counter() - started
+        stop.set()
+        during = await probing
+
+    print(f"{logins} logins, {concurrency} concurrent, in {elapsed:.1f}s: " + ", ".join(
+        f"{statuses.count(code)} x {code}" for code in sorted(set(statuses))
+    ))
+    print(f"{path} before: {percentiles(baseline)}")
+    print(f"{path} during: {percentiles(during)}")
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    asyncio.run(main(
+        args[0] if args else "http://127.0.0.1:8000",
+        int(args[1]) if len(args) > 1 else 200,
+        int(args[2]) if len(args) > 2 else 50,
+        args[3] if len(args) > 3 else "/metrics",
+    ))
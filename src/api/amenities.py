@@ -1,19 +1,24 @@
-from fastapi import APIRouter, Body
+from fastapi import APIRouter, Body, HTTPException
+from fastapi_cache import FastAPICache
 from fastapi_cache.decorator import cache
 
 from src.api.dependencies import PaginationSettings, DBSpawner
+from src.schemas.pagination import PaginationError
 from src.schemas.amenities_schemas import PaginatedAmenitiesPrintOut, Amenity
 
 router = APIRouter(prefix="/amenities", tags=["Amenities"])
 
 
 @router.get("", response_model=PaginatedAmenitiesPrintOut)
-@cache(expire=10)
+@cache(expire=10, namespace="amenities")
 async def get_all_amenities(
         db: DBSpawner,
         pagination: PaginationSettings
 ):
-    return await db.amenities.get_all_amenities(pagination)
+    try:
+        return await db.amenities.get_all_amenities(pagination)
+    except PaginationError as exc:
+        raise HTTPException(400, str(exc))
 
 
 @router.post("")
@@ -39,6 +44,7 @@ async def create_amenity(
 ):
     amenity = await db.amenities.add(amenity_data)
     await db.commit()
+    await FastAPICache.clear(namespace="amenities")
 
     return {"status": "success", "created": amenity}
 
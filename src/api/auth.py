@@ -1,11 +1,13 @@
-from fastapi import APIRouter, HTTPException, status, Response
+import math
+
+from fastapi import APIRouter, HTTPException, Request, status, Response
 from sqlalchemy.exc import IntegrityError
 
-from src.api.dependencies import CurrentUserId
+from src.api.dependencies import AuthServiceDep, CurrentUserId
 from src.models.users_models import UsersModel as UserModel
-from src.services.auth import AuthService
 from src.schemas.users_schemas import UserRequestAdd
 from src.api.dependencies import DBSpawner
+from src.init import login_email_limiter, login_ip_limiter, token_revocations
 
 router = APIRouter(prefix="/auth", tags=["Authentication and authorisation"])
 
@@ -13,9 +15,10 @@ router = APIRouter(prefix="/auth", tags=["Authentication and authorisation"])
 @router.post("/sign_up")
 async def sign_up(
         user_data: UserRequestAdd,
-        db: DBSpawner
+        db: DBSpawner,
+        auth: AuthServiceDep,
 ):
-    hashed_password = AuthService().hash_password(user_data.password)
+    hashed_password = await auth.hash_password_async(user_data.password)
     new_user = UserModel(email=user_data.email, hashed_password=hashed_password)
 
     db.session.add(new_user)
@@ -35,28 +38,55 @@ async def sign_up(
 async def log_in(
         user_data: UserRequestAdd,
         response: Response,
-        db: DBSpawner
+        db: DBSpawner,
+        auth: AuthServiceDep,
+        request: Request,
 ):
+        # Checked before any DB or bcrypt work, so brute force costs only a Redis round trip
+        retry_after = await login_ip_limiter.hit(request.client.host if request.client else "unknown")
+        if not retry_after:
+            retry_after = await login_email_limiter.hit(user_data.email.lower())
+        if retry_after:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many login attempts.",
+                headers={"Retry-After": str(math.ceil(retry_after))},
+            )
+
         user = await db.users.get_user_with_hashed_password(email=user_data.email)
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="User with this email is not registered."
             )
-        if not AuthService().verify_password(user_data.password, user.hashed_password):
+        verified, new_hash = await auth.verify_and_update_async(user_data.password, user.hashed_password)
+        if not verified:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Wrong password."
             )
-        access_token = AuthService().create_access_token({"user_id": user.id})
+        if new_hash:
+            await db.users.update_hashed_password(user.id, new_hash)
+            await db.commit()
+        access_token = auth.create_access_token({"user_id": user.id})
         response.set_cookie("access_token", access_token)
         return {"access_token": access_token}
 
 
 @router.post("/log_out")
 async def log_out(
-        response: Response
+        request: Request,
+        response: Response,
+        auth: AuthServiceDep,
 ):
+        access_token = request.cookies.get("access_token")
+        if access_token:
+            try:
+                claims = auth.decode_token(access_token)
+            except HTTPException:
+                claims = {}
+            if "jti" in claims:
+                await token_revocations.revoke(claims["jti"], claims["exp"])
         response.delete_cookie("access_token")
         return {"status": "OK"}
 
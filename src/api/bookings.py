@@ -1,8 +1,16 @@
+from datetime import date
+
 from fastapi import APIRouter, Body, Path, Query, HTTPException
+from fastapi.responses import StreamingResponse
 
 from src.api.dependencies import PaginationSettings, DBSpawner, CurrentUserId
+from src.init import search_cache
 from src.repo.bookings_repo import PaginatedBookingsPrintOut
-from src.schemas.bookings_schemas import Booking, BookingAdd
+from src.schemas.bookings_schemas import Booking, BookingsBulk
+from src.schemas.pagination import PaginationError
+from src.services.search_cache import room_tag
+from src.utils.export import MEDIA_TYPES, ExportFormat, export_chunks
+from src.utils.responses import FastJSONResponse
 
 router = APIRouter(prefix="/bookings", tags=["Bookings"])
 
@@ -12,7 +20,29 @@ async def get_all_bookings(
         db: DBSpawner,
         pagination: PaginationSettings
 ):
-    return await db.bookings.get_all_bookings(pagination)
+    try:
+        bookings = await db.bookings.get_all_bookings(pagination)
+    except PaginationError as exc:
+        raise HTTPException(400, str(exc))
+    return FastJSONResponse(bookings)
+
+
+@router.get("/export", summary="Stream bookings as NDJSON or CSV")
+async def export_bookings(
+        db: DBSpawner,
+        export_format: ExportFormat = Query("ndjson", alias="format"),
+        date_from: date | None = Query(None, description="Bookings overlapping the range from this date"),
+        date_to: date | None = Query(None, description="Bookings overlapping the range up to this date"),
+        hotel_id: int | None = Query(None),
+        user_id: int | None = Query(None),
+):
+    batches = db.bookings.stream_bookings(date_from=date_from, date_to=date_to, hotel_id=hotel_id, user_id=user_id)
+    columns = [column.key for column in db.bookings.columns()]
+    return StreamingResponse(
+        export_chunks(export_format, columns, batches),
+        media_type=MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="bookings.{export_format}"'},
+    )
 
 
 @router.get("/current_user")
@@ -21,7 +51,10 @@ async def get_bookings_current_user(
         user_id: CurrentUserId,
         pagination: PaginationSettings
 ):
-    bookings = await db.bookings.get_bookings_current_user(user_id, pagination)
+    try:
+        bookings = await db.bookings.get_bookings_current_user(user_id, pagination)
+    except PaginationError as exc:
+        raise HTTPException(400, str(exc))
     return bookings
 
 
@@ -31,19 +64,33 @@ async def create_booking(
         user_id: CurrentUserId,
         booking_data: Booking = Body(...),
 ):
-        room = await db.rooms.get_one_or_none(id=booking_data.room_id)
-        if not room:
+        [result] = await db.bookings.book(user_id, [booking_data])
+        if result.status == "room_not_found":
             raise HTTPException(404, "Room not found")
+        if result.status == "conflict":
+            raise HTTPException(409, "No rooms of this type left for these dates")
+        await db.commit()
+        await search_cache.invalidate(room_tag(booking_data.room_id))
 
-        _booking_data = BookingAdd(
-            room_id=booking_data.room_id,
-            user_id=user_id,
-            date_from=booking_data.date_from,
-            date_to=booking_data.date_to,
-            price_per_night=room.price_per_night
-        )
+        return {"status": "success", "created": result.booking_id}
 
-        booking = await db.bookings.add(_booking_data)
-        await db.commit()
 
-        return {"status": "success", "created": booking}
+@router.post("/bulk", summary="Create many bookings at once")
+async def create_bookings_bulk(
+        db: DBSpawner,
+        user_id: CurrentUserId,
+        bookings_data: BookingsBulk = Body(...),
+):
+    """
+    Books every item that still fits, in request order; items competing for the last units
+    of a room are served first come, first served. Returns one result per item.
+    """
+    results = await db.bookings.book(user_id, bookings_data.bookings)
+    await db.commit()
+    await search_cache.invalidate(*{room_tag(result.room_id) for result in results if result.status == "created"})
+
+    return {
+        "status": "success",
+        "created": sum(result.status == "created" for result in results),
+        "results": results,
+    }
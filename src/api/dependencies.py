@@ -3,7 +3,8 @@ from typing import Annotated
 from fastapi import Depends, Query, HTTPException, Request
 from pydantic import BaseModel
 
-from src.database import async_session_maker
+from src.database import async_session_maker, async_session_maker_replica
+from src.init import auth_service, token_revocations
 from src.services.auth import AuthService
 from src.utils.db_manager import DBManager
 from src.schemas.pagination import PaginationParams
@@ -18,15 +19,24 @@ def get_token(request: Request) -> str:
         raise HTTPException(status_code=401, detail="Access token not provided")
     return access_token
 
-def get_current_user_id(access_token: str = Depends(get_token)) -> int:
-    data = AuthService().decode_token(access_token)
+def get_auth_service() -> AuthService:
+    return auth_service
+
+AuthServiceDep = Annotated[AuthService, Depends(get_auth_service)]
+
+
+async def get_current_user_id(auth: AuthServiceDep, access_token: str = Depends(get_token)) -> int:
+    data = auth.decode_token(access_token)
+    # Tokens issued before jti was added cannot be revoked and stay valid until they expire
+    if "jti" in data and await token_revocations.is_revoked(data["jti"]):
+        raise HTTPException(status_code=401, detail="Access token revoked")
     return data["user_id"]
 
 CurrentUserId = Annotated[int, Depends(get_current_user_id)]
 
 
 async def get_db():
-    async with DBManager(session_factory=async_session_maker) as db:
+    async with DBManager(session_factory=async_session_maker, read_session_factory=async_session_maker_replica) as db:
         yield db
 
 DBSpawner = Annotated[DBManager, Depends(get_db)]
\ No newline at end of file
@@ -1,21 +1,26 @@
 import json
 
-from fastapi import APIRouter, Body
+from fastapi import APIRouter, Body, HTTPException
+from fastapi_cache import FastAPICache
 from fastapi_cache.decorator import cache
 
 from src.api.dependencies import PaginationSettings, DBSpawner
+from src.schemas.pagination import PaginationError
 from src.schemas.facilities_schemas import PaginatedFacilitiesPrintOut, Facility
 
 router = APIRouter(prefix="/facilities", tags=["Facilities"])
 
 
 @router.get("", response_model=PaginatedFacilitiesPrintOut)
-@cache(expire=10)
+@cache(expire=10, namespace="facilities")
 async def get_all_facilities(
         db: DBSpawner,
         pagination: PaginationSettings
 ):
-    return await db.facilities.get_all_facilities(pagination)
+    try:
+        return await db.facilities.get_all_facilities(pagination)
+    except PaginationError as exc:
+        raise HTTPException(400, str(exc))
 
 
 @router.post("")
@@ -41,6 +46,7 @@ async def create_facility(
 ):
     facility = await db.facilities.add(facility_data)
     await db.commit()
+    await FastAPICache.clear(namespace="facilities")
 
     return {"status": "success", "created": facility}
 
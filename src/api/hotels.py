@@ -1,9 +1,17 @@
+import io
 from datetime import date
 
-from fastapi import APIRouter, Body, Path, Query, HTTPException
+from fastapi import APIRouter, Body, Path, Query, HTTPException, Response, UploadFile
 
 from src.api.dependencies import PaginationSettings, DBSpawner
+from src.init import search_cache
+from src.schemas.catalog_schemas import CatalogImportReport
+from src.services.catalog_import import CatalogFormat, CatalogImporter, read_records
+from src.services.search import SearchService
+from src.services.search_cache import HOTELS_SEARCH_TAG, hotel_tag
 from src.schemas.hotels_schemas import Hotel, HotelPatch, PaginatedHotelsPrintOut, HotelUpdate
+from src.schemas.pagination import PaginationError
+from src.utils.responses import FastJSONResponse
 
 
 router = APIRouter(prefix="/hotels", tags=["Hotels"])
@@ -14,7 +22,11 @@ async def get_all_hotels(
         db: DBSpawner,
         pagination: PaginationSettings
 ):
-    return await db.hotels.get_all_hotels(pagination)
+    try:
+        hotels = await db.hotels.get_all_hotels(pagination)
+    except PaginationError as exc:
+        raise HTTPException(400, str(exc))
+    return FastJSONResponse(hotels, exclude_none=True)
 
 
 @router.get("/search", summary="Search available hotels", response_model=PaginatedHotelsPrintOut | dict)
@@ -25,16 +37,45 @@ async def search_hotels(
     location: str | None = Query(None, description="Location of the hotel"),
     date_from: date | None = Query(None, example="2026-01-11"),
     date_to: date | None = Query(None, example="2026-02-22"),
+    fuzzy: bool = Query(False, description="Typo-tolerant name/location match, ranked by similarity"),
 ):
     if (date_from is None) != (date_to is None):
         raise HTTPException(422, "Both date_from and date_to must be provided together")
-    return await db.hotels.search_hotels(
-        pagination,
-        location=location,
-        name=name,
-        date_to=date_to,
-        date_from=date_from,
-    )
+    try:
+        payload = await SearchService(db).search_hotels(
+            pagination,
+            location=location,
+            name=name,
+            date_to=date_to,
+            date_from=date_from,
+            fuzzy=fuzzy,
+        )
+    except PaginationError as exc:
+        raise HTTPException(400, str(exc))
+    return Response(content=payload, media_type="application/json")
+
+
+@router.post("/import", summary="Bulk import hotels and rooms", response_model=CatalogImportReport)
+async def import_catalog(
+        db: DBSpawner,
+        file: UploadFile,
+        catalog_format: CatalogFormat | None = Query(None, alias="format", description="Defaults to csv for .csv files, jsonl otherwise"),
+):
+    """
+    One room per JSON line or CSV row: hotel_name, hotel_location, room_name, description,
+    price_per_night, quantity, facility_ids, amenity_ids (ids separated by ';' in CSV).
+    Rows are imported in batches; the report lists every rejected row by line number.
+    """
+    catalog_format = catalog_format or ("csv" if (file.filename or "").endswith(".csv") else "jsonl")
+    lines = io.TextIOWrapper(file.file, encoding="utf-8", newline="")
+    importer = CatalogImporter(db)
+    report = await importer.run(read_records(lines, catalog_format))
+    tags = [hotel_tag(hotel_id) for hotel_id in importer.hotel_ids]
+    if report.hotels_created or report.rooms_created:
+        tags.append(HOTELS_SEARCH_TAG)
+    if tags:
+        await search_cache.invalidate(*tags)
+    return report
 
 
 @router.get("/{hotel_id}", summary="Get hotel by ID")
@@ -42,12 +83,11 @@ async def get_hotel(
         hotel_id: int,
         db: DBSpawner
 ):
-        hotel = await db.hotels.get_one_or_none(id=hotel_id)
-        if not hotel:
+        payload = await SearchService(db).get_hotel(hotel_id)
+        if payload is None:
             raise HTTPException(404, "Hotel not found")
-        rooms = await db.rooms.get_filtered(hotel_id=hotel_id)
 
-        return {"hotel": hotel, "rooms": rooms}
+        return Response(content=payload, media_type="application/json")
 
 
 @router.delete("/{hotel_id}")
@@ -59,6 +99,7 @@ async def delete_hotel(
     if not deleted_hotel:
         raise HTTPException(404, "Hotel not found")
     await db.commit()
+    await search_cache.invalidate(hotel_tag(hotel_id))
     return {"status": "success", "deleted": deleted_hotel}
 
 
@@ -85,6 +126,7 @@ async def create_hotel(
 ):
     hotel = await db.hotels.add(hotel_data)
     await db.commit()
+    await search_cache.invalidate(HOTELS_SEARCH_TAG)
     return {"status": "success", "created": hotel}
 
 
@@ -96,6 +138,7 @@ async def update_hotel(
 ):
     hotel = await db.hotels.update(hotel_id, hotel_data)
     await db.commit()
+    await search_cache.invalidate(hotel_tag(hotel_id), HOTELS_SEARCH_TAG)
     return {"status": "success", "updated": hotel}
 
 
@@ -107,4 +150,5 @@ async def patch_hotel(
 ):
     hotel = await db.hotels.edit(hotel_id, hotel_data)
     await db.commit()
+    await search_cache.invalidate(hotel_tag(hotel_id), HOTELS_SEARCH_TAG)
     return {"status": "success", "patched": hotel}
@@ -0,0 +1,34 @@
+from fastapi import APIRouter
+
+from src.database import engine, engine_replica
+from src.init import (
+    auth_service,
+    cache_backend,
+    login_email_limiter,
+    login_ip_limiter,
+    password_hasher,
+    search_cache,
+    token_revocations,
+)
+from src.utils.pool_metrics import pool_metrics, replica_pool_metrics
+
+router = APIRouter(prefix="/metrics", tags=["Metrics"])
+
+
+@router.get("", summary="Per-worker runtime counters")
+async def get_metrics():
+    return {
+        "db_pool": pool_metrics.snapshot(engine.pool),
+        "db_replica_pool": replica_pool_metrics.snapshot(engine_replica.pool) if engine_replica else None,
+        "cache": cache_backend.stats(),
+        "search_cache": {
+            "computations": search_cache.single_flight.calls,
+            "coalesced": search_cache.single_flight.coalesced,
+            "early_refreshes": search_cache.early_refreshes,
+            "stale_writes_skipped": search_cache.stale_writes_skipped,
+        },
+        "password_hasher": password_hasher.stats(),
+        "auth_claims_cache": auth_service.claims_cache.stats(),
+        "token_revocations": token_revocations.stats(),
+        "login_rate_limits": {"ip": login_ip_limiter.stats(), "email": login_email_limiter.stats()},
+    }
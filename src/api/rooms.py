@@ -1,12 +1,15 @@
 from datetime import date
 
-from fastapi import APIRouter, Body, Path, Query, HTTPException
+from fastapi import APIRouter, Body, Path, Query, HTTPException, Response
 
 from src.models.hotels_models import HotelsModel
 from src.schemas.amenities_schemas import RoomAmenityAdd
 from src.schemas.facilities_schemas import RoomFacilityAdd
 from src.schemas.rooms_schemas import RoomCreate, RoomUpdate, RoomPatch, RoomCreateInternal, Room, RoomUpdateInternal, RoomWithRelations
 from src.api.dependencies import DBSpawner
+from src.init import search_cache
+from src.services.search import SearchService
+from src.services.search_cache import HOTELS_SEARCH_TAG, hotel_tag, room_tag
 
 
 rooms_router = APIRouter(prefix="/hotels/{hotel_id}/rooms", tags=["Rooms"])
@@ -19,11 +22,12 @@ async def search_rooms(
     date_from: date | None = Query(None, example="2026-01-01", description="Search availability of rooms with date from filter applied"),
     date_to: date | None = Query(None, example="2026-02-22", description="Search availability of rooms with date to filter applied")
 ):
-    return await db.rooms.search_rooms(
+    payload = await SearchService(db).search_rooms(
         hotel_id=hotel_id,
         date_from=date_from,
         date_to=date_to
     )
+    return Response(content=payload, media_type="application/json")
 
 
 @rooms_router.get("/{room_id}", response_model=RoomWithRelations, response_model_exclude_none=True)
@@ -80,12 +84,13 @@ async def create_room(
         RoomCreateInternal(**_room_data)
     )
 
-    room_facilities = [RoomFacilityAdd(room_id=room, facility_id=facility_id) for facility_id in room_data.facility_ids]
-    room_amenities = [RoomAmenityAdd(room_id=room, amenity_id=amenity_id) for amenity_id in room_data.amenity_ids]
+    room_facilities = [RoomFacilityAdd(room_id=room, facility_id=facility_id) for facility_id in set(room_data.facility_ids)]
+    room_amenities = [RoomAmenityAdd(room_id=room, amenity_id=amenity_id) for amenity_id in set(room_data.amenity_ids)]
     await db.room_facilities.add_bulk(room_facilities)
     await db.room_amenities.add_bulk(room_amenities)
 
     await db.commit()
+    await search_cache.invalidate(hotel_tag(hotel_id), HOTELS_SEARCH_TAG)
 
     return {"status": "success", "created": room}
 
@@ -106,6 +111,12 @@ async def edit_room(
     await db.room_facilities.set_room_facilities(room_id, room_data.facility_ids)
     await db.room_amenities.set_room_amenities(room_id, room_data.amenity_ids)
     await db.commit()
+
+    tags = [room_tag(room_id), hotel_tag(hotel_id), hotel_tag(room_data.new_hotel_id)]
+    if room_data.quantity > existing_room.quantity or room_data.new_hotel_id != hotel_id:
+        # More free units, or a move to another hotel, can add hotels to any search result.
+        tags.append(HOTELS_SEARCH_TAG)
+    await search_cache.invalidate(*tags)
     return {"status": "OK", "updated": room_id}
 
 
@@ -133,12 +144,19 @@ async def partially_edit_room(
         await db.rooms.edit(room_id, RoomPatch(**scalar_data))
 
     await db.commit()
+
+    tags = [room_tag(room_id), hotel_tag(hotel_id)]
+    new_hotel_id = scalar_data.get("hotel_id") or hotel_id
+    if new_hotel_id != hotel_id or (scalar_data.get("quantity") or 0) > existing_room.quantity:
+        tags += [hotel_tag(new_hotel_id), HOTELS_SEARCH_TAG]
+    await search_cache.invalidate(*tags)
     return {"status": "OK", "patched": room_id}
 
 
 @rooms_router.delete("/{room_id}")
 async def delete_room_by_id(
     db: DBSpawner,
+    hotel_id: int,
     room_id: int = Path(description="ID of the room")
 ):
 
@@ -146,5 +164,6 @@ async def delete_room_by_id(
     if not deleted_room:
         raise HTTPException(404, "Room not found")
     await db.commit()
+    await search_cache.invalidate(room_tag(room_id), hotel_tag(hotel_id))
 
     return {"status": "success", "deleted": deleted_room}
\ No newline at end of file
@@ -13,8 +13,53 @@ class Settings(BaseSettings):
     DB_USER: str
     DB_PASSWORD: str
 
+    # Optional read replica; unset fields fall back to the primary's (e.g. only DB_REPLICA_HOST differs)
+    DB_REPLICA_HOST: str | None = None
+    DB_REPLICA_PORT: int | None = None
+    DB_REPLICA_NAME: str | None = None
+
+    # Connection pool of each worker process: size it so workers * (size + overflow) fits max_connections
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30
+    DB_POOL_RECYCLE: int = -1
+    DB_POOL_PRE_PING: bool = False
+
     REDIS_HOST: str
     REDIS_PORT: int
+    # Per-process Redis pool; REDIS_SOCKET_TIMEOUT also bounds idle pub/sub reads, so it is unset by default
+    REDIS_MAX_CONNECTIONS: int = 50
+    REDIS_POOL_TIMEOUT: float | None = 5
+    REDIS_SOCKET_TIMEOUT: float | None = None
+    REDIS_SOCKET_CONNECT_TIMEOUT: float | None = 5
+    REDIS_HEALTH_CHECK_INTERVAL: int = 30
+
+    # Seconds a cached search/hotel response lives unless a write invalidates it first
+    SEARCH_CACHE_EXPIRE: int = 300
+    # Seconds a worker holds the Redis lock while computing a missed search entry; unset = per-worker coalescing only
+    SEARCH_CACHE_LOCK_TIMEOUT: float | None = None
+    # Cache warmup (Celery beat): every interval seconds, recompute up to budget uncached searches
+    # among the most popular candidates
+    SEARCH_WARMUP_INTERVAL: int = 60
+    SEARCH_WARMUP_BUDGET: int = 50
+    SEARCH_WARMUP_CANDIDATES: int = 200
+    # Per-worker in-process cache in front of Redis for the fastapi_cache endpoints
+    CACHE_L1_MAXSIZE: int = 1024
+    CACHE_L1_TTL: int = 10
+
+    # bcrypt work factor; stored hashes with fewer rounds are rehashed on the next login
+    BCRYPT_ROUNDS: int = 12
+    # Threads hashing passwords off the event loop, and how many calls may wait for one (503 beyond that)
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_QUEUE: int = 256
+    # Verified token claims kept per worker, so repeat requests skip JWT signature checks
+    AUTH_CLAIMS_CACHE_SIZE: int = 10_000
+    # Login attempts allowed per client IP and per email within the window (seconds)
+    LOGIN_RATE_LIMIT_WINDOW: int = 60
+    LOGIN_RATE_LIMIT_PER_IP: int = 20
+    LOGIN_RATE_LIMIT_PER_EMAIL: int = 5
+    # Revoked tokens each worker's bloom filter is sized for before it is rebuilt
+    REVOKED_TOKENS_CAPACITY: int = 100_000
 
 
     @property
@@ -26,6 +71,15 @@ class Settings(BaseSettings):
     def DATABASE_URL(self):
         return f"postgresql+asyncpg://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
 
+    @property
+    def DATABASE_REPLICA_URL(self):
+        if not (self.DB_REPLICA_HOST or self.DB_REPLICA_PORT or self.DB_REPLICA_NAME):
+            return None
+        host = self.DB_REPLICA_HOST or self.DB_HOST
+        port = self.DB_REPLICA_PORT or self.DB_PORT
+        name = self.DB_REPLICA_NAME or self.DB_NAME
+        return f"postgresql+asyncpg://{self.DB_USER}:{self.DB_PASSWORD}@{host}:{port}/{name}"
+
     # JWT Token generation variables
     JWT_SECRET_KEY: str
     JWT_ALGORITHM: str
@@ -1,14 +1,56 @@
+from typing import Iterable, Mapping
+
 import redis.asyncio as redis
 
 
 class RedisConnector:
-    def __init__(self, host: str, port: int):
+    """
+    Shared Redis client of a process over one bounded connection pool.
+
+    A command waits up to `pool_timeout` seconds for a free connection once
+    `max_connections` are in use. `socket_timeout` also bounds blocking pub/sub reads, so
+    leave it unset when subscribers should idle indefinitely. Idle connections are
+    pinged before reuse every `health_check_interval` seconds (0 disables it).
+    """
+
+    def __init__(
+            self,
+            host: str,
+            port: int,
+            max_connections: int = 50,
+            pool_timeout: float | None = 5,
+            socket_timeout: float | None = None,
+            socket_connect_timeout: float | None = 5,
+            health_check_interval: int = 0,
+    ):
         self.host = host
         self.port = port
+        self.max_connections = max_connections
+        self.pool_timeout = pool_timeout
+        self.socket_timeout = socket_timeout
+        self.socket_connect_timeout = socket_connect_timeout
+        self.health_check_interval = health_check_interval
         self.redis = None
 
     async def connect(self):
-        self.redis = await redis.Redis(host=self.host, port=self.port)
+        pool = redis.BlockingConnectionPool(
+            host=self.host,
+            port=self.port,
+            max_connections=self.max_connections,
+            timeout=self.pool_timeout,
+            socket_timeout=self.socket_timeout,
+            socket_connect_timeout=self.socket_connect_timeout,
+            health_check_interval=self.health_check_interval,
+        )
+        # from_pool hands the pool to the client, so disconnect() closes its connections too
+        self.redis = redis.Redis.from_pool(pool)
+
+    def pipeline(self, transaction: bool = True):
+        """
+        Commands queued on the returned pipeline go out in one round trip on `execute()`,
+        wrapped in MULTI/EXEC when `transaction` is set. Use it as `async with`.
+        """
+        return self.redis.pipeline(transaction=transaction)
 
     async def set(self, key: str, value: str, expire: int = None):
         if expire:
@@ -19,9 +61,40 @@ class RedisConnector:
     async def get(self, key: str):
         return await self.redis.get(key)
 
+    async def mget(self, keys: Iterable[str]) -> list:
+        """Values of `keys` in order, None for missing ones, in one round trip."""
+        keys = list(keys)
+        return await self.redis.mget(keys) if keys else []
+
+    async def mset(self, mapping: Mapping[str, bytes | str], expire: int = None):
+        """Sets all keys in one round trip; MSET has no TTL, so with `expire` it pipelines SETs."""
+        if not mapping:
+            return
+        if not expire:
+            await self.redis.mset(mapping)
+            return
+        async with self.pipeline(transaction=False) as pipe:
+            for key, value in mapping.items():
+                pipe.set(key, value, ex=expire)
+            await pipe.execute()
+
     async def delete(self, key: str):
         await self.redis.delete(key)
 
+    async def delete_many(self, keys: Iterable[str]) -> int:
+        keys = list(keys)
+        return await self.redis.delete(*keys) if keys else 0
+
+    async def add_to_set(self, key: str, *members: str, expire: int = None):
+        async with self.pipeline(transaction=True) as pipe:
+            pipe.sadd(key, *members)
+            if expire:
+                pipe.expire(key, expire)
+            await pipe.execute()
+
+    async def get_set(self, key: str):
+        return await self.redis.smembers(key)
+
     async def disconnect(self):
         if self.redis:
-            await self.redis.close()
+            await self.redis.aclose()
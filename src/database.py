@@ -3,11 +3,19 @@ from sqlalchemy.pool.impl import NullPool
 from sqlalchemy.orm import DeclarativeBase
 
 from src.config import settings
+from src.utils.pool_metrics import InstrumentedPool, instrument_pool, replica_pool_metrics
 
 engine = create_async_engine(
     settings.DATABASE_URL,
-    echo=False  # change to True to see query in terminal
+    echo=False,  # change to True to see query in terminal
+    poolclass=InstrumentedPool,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
 )
+instrument_pool(engine)
 
 engine_null_pool = create_async_engine(
     settings.DATABASE_URL,
@@ -15,7 +23,22 @@ engine_null_pool = create_async_engine(
     poolclass=NullPool
 )
 
+engine_replica = create_async_engine(
+    settings.DATABASE_REPLICA_URL,
+    echo=False,
+    poolclass=InstrumentedPool.with_metrics(replica_pool_metrics),
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+) if settings.DATABASE_REPLICA_URL else None
+if engine_replica:
+    instrument_pool(engine_replica, replica_pool_metrics)
+
 async_session_maker = async_sessionmaker(bind=engine, expire_on_commit=False)
+# None without a configured replica: repositories then read from the primary
+async_session_maker_replica = async_sessionmaker(bind=engine_replica, expire_on_commit=False) if engine_replica else None
 async_session_maker_null_pool = async_sessionmaker(bind=engine_null_pool, expire_on_commit=False)
 
 class BaseModel(DeclarativeBase):
@@ -1,7 +1,47 @@
 from src.connectors.redis_connector import RedisConnector
 from src.config import settings
+from src.services.auth import AuthService
+from src.services.search_cache import SearchCache
+from src.services.token_store import TokenRevocations
+from src.utils.cache import TwoTierBackend
+from src.utils.offload import BoundedExecutor
+from src.utils.rate_limit import SlidingWindowLimiter
 
 redis_connector = RedisConnector(
     host=settings.REDIS_HOST,
     port=settings.REDIS_PORT,
+    max_connections=settings.REDIS_MAX_CONNECTIONS,
+    pool_timeout=settings.REDIS_POOL_TIMEOUT,
+    socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+    socket_connect_timeout=settings.REDIS_SOCKET_CONNECT_TIMEOUT,
+    health_check_interval=settings.REDIS_HEALTH_CHECK_INTERVAL,
+)
+
+search_cache = SearchCache(
+    redis_connector,
+    expire=settings.SEARCH_CACHE_EXPIRE,
+    lock_timeout=settings.SEARCH_CACHE_LOCK_TIMEOUT,
+)
+
+cache_backend = TwoTierBackend(
+    redis_connector,
+    maxsize=settings.CACHE_L1_MAXSIZE,
+    l1_ttl=settings.CACHE_L1_TTL,
+)
+
+password_hasher = BoundedExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_queue=settings.PASSWORD_HASH_QUEUE,
+    name="password-hasher",
+)
+
+auth_service = AuthService(password_hasher, claims_cache_size=settings.AUTH_CLAIMS_CACHE_SIZE)
+
+token_revocations = TokenRevocations(redis_connector, capacity=settings.REVOKED_TOKENS_CAPACITY)
+
+login_ip_limiter = SlidingWindowLimiter(
+    redis_connector, "login:ip", limit=settings.LOGIN_RATE_LIMIT_PER_IP, window=settings.LOGIN_RATE_LIMIT_WINDOW,
+)
+login_email_limiter = SlidingWindowLimiter(
+    redis_connector, "login:email", limit=settings.LOGIN_RATE_LIMIT_PER_EMAIL, window=settings.LOGIN_RATE_LIMIT_WINDOW,
 )
@@ -1,12 +1,11 @@
+import asyncio
 import sys
 import uvicorn
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from fastapi import FastAPI
 from pathlib import Path
 
 from fastapi_cache import FastAPICache
-from fastapi_cache.backends.redis import RedisBackend
-from fastapi_cache.decorator import cache
 
 sys.path.append(str(Path(__file__).parent.parent))
 
@@ -17,15 +16,24 @@ from src.api.bookings import router as router_bookings
 from src.api.facilities import router as router_facilities
 from src.api.amenities import router as router_amenities
 from src.api.images import router as router_images
-from src.init import redis_connector
+from src.api.metrics import router as router_metrics
+from src.init import cache_backend, password_hasher, redis_connector, token_revocations
+from src.utils.cache import request_key_builder
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     await redis_connector.connect()
-    FastAPICache.init(RedisBackend(redis_connector.redis), prefix="fastapi-cache")
+    FastAPICache.init(cache_backend, prefix="fastapi-cache", key_builder=request_key_builder)
+    await token_revocations.load()
+    listeners = [asyncio.create_task(cache_backend.listen()), asyncio.create_task(token_revocations.listen())]
     yield
+    for listener in listeners:
+        listener.cancel()
+        with suppress(asyncio.CancelledError):
+            await listener
     await redis_connector.disconnect()
+    password_hasher.shutdown()
 
 
 app = FastAPI(lifespan=lifespan)
@@ -37,6 +45,7 @@ app.include_router(router_bookings)
 app.include_router(router_facilities)
 app.include_router(router_amenities)
 app.include_router(router_images)
+app.include_router(router_metrics)
 
 
 if __name__ == "__main__":
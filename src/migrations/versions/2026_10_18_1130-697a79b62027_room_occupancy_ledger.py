@@ -0,0 +1,50 @@
+"""room occupancy ledger
+
+Revision ID: 697a79b62027
+Revises: e85f465fa26c
+Create Date: 2026-10-18 11:30:12.402117
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "697a79b62027"
+down_revision: Union[str, None] = "e85f465fa26c"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "room_occupancy",
+        sa.Column("room_id", sa.Integer(), nullable=False),
+        sa.Column("night", sa.Date(), nullable=False),
+        sa.Column("booked", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["room_id"], ["rooms.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("room_id", "night"),
+    )
+    op.create_index(
+        "ix_room_occupancy_night_room_id", "room_occupancy", ["night", "room_id"]
+    )
+
+    # Backfill the ledger from the existing bookings: one row per room per booked night.
+    op.execute(
+        """
+        INSERT INTO room_occupancy (room_id, night, booked)
+        SELECT b.room_id, b.date_from + night_offset, count(*)
+        FROM bookings AS b, generate_series(0, b.date_to - b.date_from - 1) AS night_offset
+        GROUP BY b.room_id, b.date_from + night_offset
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_room_occupancy_night_room_id", table_name="room_occupancy")
+    op.drop_table("room_occupancy")
@@ -0,0 +1,77 @@
+"""hot path indexes
+
+Revision ID: 154ce0433ebf
+Revises: 697a79b62027
+Create Date: 2026-10-18 14:15:41.508313
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "154ce0433ebf"
+down_revision: Union[str, None] = "697a79b62027"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+
+    op.create_index(
+        "ix_bookings_room_id_date_from_date_to",
+        "bookings",
+        ["room_id", "date_from", "date_to"],
+    )
+    op.create_index("ix_bookings_user_id", "bookings", ["user_id"])
+    op.create_index("ix_bookings_date_from", "bookings", ["date_from"])
+    op.create_index(
+        "ix_bookings_room_id_stay",
+        "bookings",
+        ["room_id", sa.text("daterange(date_from, date_to)")],
+        postgresql_using="gist",
+    )
+
+    op.create_index("ix_rooms_hotel_id", "rooms", ["hotel_id"])
+
+    # Drop duplicated links before making (room_id, *_id) unique.
+    op.execute(
+        """
+        DELETE FROM room_facilities a USING room_facilities b
+        WHERE a.room_id = b.room_id AND a.facility_id = b.facility_id AND a.id > b.id
+        """
+    )
+    op.create_index(
+        "ix_room_facilities_room_id_facility_id",
+        "room_facilities",
+        ["room_id", "facility_id"],
+        unique=True,
+    )
+    op.execute(
+        """
+        DELETE FROM room_amenities a USING room_amenities b
+        WHERE a.room_id = b.room_id AND a.amenity_id = b.amenity_id AND a.id > b.id
+        """
+    )
+    op.create_index(
+        "ix_room_amenities_room_id_amenity_id",
+        "room_amenities",
+        ["room_id", "amenity_id"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_room_amenities_room_id_amenity_id", table_name="room_amenities")
+    op.drop_index("ix_room_facilities_room_id_facility_id", table_name="room_facilities")
+    op.drop_index("ix_rooms_hotel_id", table_name="rooms")
+    op.drop_index("ix_bookings_room_id_stay", table_name="bookings")
+    op.drop_index("ix_bookings_date_from", table_name="bookings")
+    op.drop_index("ix_bookings_user_id", table_name="bookings")
+    op.drop_index("ix_bookings_room_id_date_from_date_to", table_name="bookings")
@@ -0,0 +1,43 @@
+"""hotels trigram indexes
+
+Revision ID: 591d92db90eb
+Revises: 154ce0433ebf
+Create Date: 2026-10-18 16:10:27.914650
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "591d92db90eb"
+down_revision: Union[str, None] = "154ce0433ebf"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "ix_hotels_name_trgm",
+        "hotels",
+        ["name"],
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_hotels_location_trgm",
+        "hotels",
+        ["location"],
+        postgresql_using="gin",
+        postgresql_ops={"location": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_hotels_location_trgm", table_name="hotels")
+    op.drop_index("ix_hotels_name_trgm", table_name="hotels")
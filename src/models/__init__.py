@@ -2,5 +2,6 @@ from src.models.amenities_models import AmenitiesModel, RoomAmenitiesModel
 from src.models.bookings_models import BookingsModel
 from src.models.facilities_models import FacilitiesModel, RoomFacilitiesModel
 from src.models.hotels_models import HotelsModel
+from src.models.occupancy_models import RoomOccupancyModel
 from src.models.rooms_models import RoomsModel
 from src.models.users_models import UsersModel
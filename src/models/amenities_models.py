@@ -1,4 +1,4 @@
-from sqlalchemy import String, ForeignKey
+from sqlalchemy import String, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.database import BaseModel
@@ -22,4 +22,8 @@ class RoomAmenitiesModel(BaseModel):
 
     id: Mapped[int] = mapped_column(primary_key=True)
     room_id: Mapped[int] = mapped_column(ForeignKey("rooms.id"))
-    amenity_id: Mapped[int] = mapped_column(ForeignKey("amenities.id"))
\ No newline at end of file
+    amenity_id: Mapped[int] = mapped_column(ForeignKey("amenities.id"))
+
+    __table_args__ = (
+        Index("ix_room_amenities_room_id_amenity_id", "room_id", "amenity_id", unique=True),
+    )
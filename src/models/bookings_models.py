@@ -3,7 +3,7 @@ from uuid import UUID
 
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.ext.hybrid import hybrid_property
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index, column, func
 from sqlalchemy.dialects.postgresql import UUID as PostgreSQL_UUID
 import uuid
 
@@ -24,6 +24,19 @@ class BookingsModel(BaseModel):
     date_to: Mapped[date]
     price_per_night: Mapped[int]
 
+    __table_args__ = (
+        Index("ix_bookings_room_id_date_from_date_to", "room_id", "date_from", "date_to"),
+        Index("ix_bookings_user_id", "user_id"),
+        Index("ix_bookings_date_from", "date_from"),
+        # Serves `daterange(date_from, date_to) && daterange(...)` overlap lookups (needs btree_gist).
+        Index(
+            "ix_bookings_room_id_stay",
+            "room_id",
+            func.daterange(column("date_from"), column("date_to")),
+            postgresql_using="gist",
+        ),
+    )
+
     @hybrid_property
     def total_nights(self) -> int:
         return (self.date_to - self.date_from).days
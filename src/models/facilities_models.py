@@ -1,4 +1,4 @@
-from sqlalchemy import String, ForeignKey
+from sqlalchemy import String, ForeignKey, Index
 from sqlalchemy.orm import Mapped, relationship, mapped_column
 
 from src.database import BaseModel
@@ -22,4 +22,8 @@ class RoomFacilitiesModel(BaseModel):
 
     id: Mapped[int] = mapped_column(primary_key=True)
     room_id: Mapped[int] = mapped_column(ForeignKey("rooms.id"))
-    facility_id: Mapped[int] = mapped_column(ForeignKey("facilities.id"))
\ No newline at end of file
+    facility_id: Mapped[int] = mapped_column(ForeignKey("facilities.id"))
+
+    __table_args__ = (
+        Index("ix_room_facilities_room_id_facility_id", "room_id", "facility_id", unique=True),
+    )
@@ -1,5 +1,5 @@
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import String, BigInteger
+from sqlalchemy import String, BigInteger, Index
 
 from src.database import BaseModel
 
@@ -12,3 +12,9 @@ class HotelsModel(BaseModel):
     location: Mapped[str]
 
     rooms: Mapped[list["RoomsModel"]] = relationship(back_populates="hotel")
+
+    # Trigram GIN indexes (pg_trgm) serve both ILIKE '%...%' filters and fuzzy `%>` search.
+    __table_args__ = (
+        Index("ix_hotels_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+        Index("ix_hotels_location_trgm", "location", postgresql_using="gin", postgresql_ops={"location": "gin_trgm_ops"}),
+    )
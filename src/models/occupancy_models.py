@@ -0,0 +1,25 @@
+from datetime import date
+
+from sqlalchemy import ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.database import BaseModel
+
+
+class RoomOccupancyModel(BaseModel):
+    """
+    Per-room, per-night occupancy ledger.
+
+    A booking from date_from to date_to occupies the nights date_from ... date_to - 1.
+    BookingsRepository keeps this table in sync with bookings inside the same transaction,
+    so availability queries only read the nights of the requested window.
+    """
+    __tablename__ = "room_occupancy"
+
+    room_id: Mapped[int] = mapped_column(ForeignKey("rooms.id", ondelete="CASCADE"), primary_key=True)
+    night: Mapped[date] = mapped_column(primary_key=True)
+    booked: Mapped[int] = mapped_column(default=0)
+
+    __table_args__ = (
+        Index("ix_room_occupancy_night_room_id", "night", "room_id"),
+    )
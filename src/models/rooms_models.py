@@ -1,5 +1,5 @@
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index
 
 from src.database import BaseModel
 
@@ -22,4 +22,8 @@ class RoomsModel(BaseModel):
         secondary="room_amenities",
     )
 
-    hotel: Mapped["HotelsModel"] = relationship(back_populates="rooms")
\ No newline at end of file
+    hotel: Mapped["HotelsModel"] = relationship(back_populates="rooms")
+
+    __table_args__ = (
+        Index("ix_rooms_hotel_id", "hotel_id"),
+    )
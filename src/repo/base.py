@@ -1,22 +1,63 @@
-from sqlalchemy import delete, insert, select, update
+from functools import cache
+
+from typing import Iterable
+
+from sqlalchemy import bindparam, delete, func, insert, inspect, select, text, tuple_, update
+from sqlalchemy.dialects.postgresql import ARRAY, insert as pg_insert
 
 from pydantic import BaseModel
 
+from src.schemas.pagination import PaginationError, PaginationParams, decode_cursor, encode_cursor
+
+
+# session.info flag set once a unit of work commits: from then on it reads from the primary
+PINNED_TO_PRIMARY = "pinned_to_primary"
+
 
 class BaseRepository:
     model = None
     schema: type[BaseModel] = None
 
-    def __init__(self, session):
+    def __init__(self, session, read_session=None):
         self.session = session
+        self.read_session = read_session
+
+    @property
+    def reader(self):
+        """
+        Session for read-only queries: the replica, unless there is none or this unit of work
+        has used the primary: while a transaction is open its reads must see its own writes,
+        and after a commit (see DBManager.commit) the lagging replica may not have them yet.
+        """
+        if (
+                self.read_session is None
+                or self.session.in_transaction()
+                or self.session.info.get(PINNED_TO_PRIMARY)
+        ):
+            return self.session
+        return self.read_session
+
+    @classmethod
+    @cache
+    def columns(cls) -> tuple:
+        """
+        The model columns behind the schema's fields. Read-only queries select these instead of
+        the entity, so rows come back as plain tuples: no identity map, no instrumented objects.
+        """
+        return tuple(
+            getattr(cls.model, attribute.key)
+            for attribute in inspect(cls.model).column_attrs
+            if attribute.key in cls.schema.model_fields
+        )
+
+    def to_schemas(self, rows) -> list:
+        """Schemas from rows of columns(); extra columns such as total_found are ignored."""
+        return [self.schema.model_validate(row._asdict()) for row in rows]
 
     async def get_all(self, *args, **kwargs):
-        query = select(self.model)
-        result = await self.session.execute(query)
-        return [
-            self.schema.model_validate(model, from_attributes=True)
-            for model in result.scalars().all()
-        ]
+        query = select(*self.columns())
+        result = await self.reader.execute(query)
+        return self.to_schemas(result.all())
 
     async def get_one_or_none(self, **filter_by):
         query = select(self.model).filter_by(**filter_by)
@@ -34,8 +75,15 @@ class BaseRepository:
         return result.scalars().one_or_none()
 
     async def add_bulk(self, data: list[BaseModel]):
-        stmt = insert(self.model).values([item.model_dump() for item in data])
-        await self.session.execute(stmt)
+        """
+        Multi-row insert, returning the new ids in input order. SQLAlchemy sends large lists
+        as several multi-row INSERTs, each within the driver's bind-parameter limit.
+        """
+        if not data:
+            return []
+        stmt = insert(self.model).returning(self.model.id, sort_by_parameter_order=True)
+        result = await self.session.execute(stmt, [item.model_dump() for item in data])
+        return result.scalars().all()
 
     async def delete(self, id_: int):
         stmt = delete(self.model).where(self.model.id == id_).returning(self.model.id)
@@ -46,6 +94,45 @@ class BaseRepository:
         stmt = delete(self.model).filter_by(**filters)
         await self.session.execute(stmt)
 
+    async def sync_m2m(self, owner_column, target_column, links: dict[int, Iterable[int]]) -> None:
+        """
+        Makes the association rows of every owner in `links` exactly its target ids, e.g.
+        `{room_id: facility_ids}` on room_facilities, in one statement for any number of owners:
+
+            WITH wanted AS (unnest of the (owner, target) pairs),
+                 deleted AS (DELETE the owners' rows NOT IN wanted)
+            INSERT wanted ON CONFLICT (owner, target) DO NOTHING
+
+        Both sides run on the same snapshot and touch disjoint rows. The ON CONFLICT target
+        needs a unique index on (owner_column, target_column).
+        """
+        if not links:
+            return
+        pairs = [(owner_id, target_id) for owner_id, target_ids in links.items() for target_id in dict.fromkeys(target_ids)]
+        wanted = (
+            select(func.unnest(
+                bindparam("owner_ids", [owner_id for owner_id, _ in pairs], type_=ARRAY(owner_column.type)),
+                bindparam("target_ids", [target_id for _, target_id in pairs], type_=ARRAY(target_column.type)),
+            ).table_valued("owner_id", "target_id").render_derived())
+            .cte("wanted")
+        )
+        wanted_pairs = select(wanted.c.owner_id, wanted.c.target_id)
+        deleted = (
+            delete(self.model)
+            .where(
+                owner_column.in_(list(links)),
+                tuple_(owner_column, target_column).not_in(wanted_pairs),
+            )
+            .cte("deleted")
+        )
+        stmt = (
+            pg_insert(self.model)
+            .from_select([owner_column, target_column], wanted_pairs)
+            .on_conflict_do_nothing(index_elements=[owner_column, target_column])
+            .add_cte(deleted)
+        )
+        await self.session.execute(stmt)
+
     async def update(self, id_: int, model_instance: BaseModel):
         values = model_instance.model_dump(exclude={"id"})
         stmt = (
@@ -70,9 +157,75 @@ class BaseRepository:
 
     async def get_filtered(self, *filter, **filter_by):
         query = (
-            select(self.model)
+            select(*self.columns())
+            .select_from(self.model)
             .filter(*filter)
             .filter_by(**filter_by)
         )
-        result = await self.session.execute(query)
-        return [self.schema.model_validate(model, from_attributes=True) for model in result.scalars().all()]
+        result = await self.reader.execute(query)
+        return self.to_schemas(result.all())
+
+    async def get_paginated(self, pagination: PaginationParams, *filter):
+        """Returns (items, total_found, next_cursor) for one page of this repository's schema."""
+        query = select(*self.columns()).filter(*filter)
+        rows, total, next_cursor = await self.paginate(query, pagination, estimate_total=not filter)
+        return self.to_schemas(rows), total, next_cursor
+
+    async def paginate(
+            self,
+            query,
+            pagination: PaginationParams,
+            estimate_total: bool = False,
+            order_by: tuple = (),
+    ):
+        """
+        Returns (rows, total_found, next_cursor) for one page of `query` ordered by id.
+
+        In offset mode the total comes from `count(*) OVER ()` in the page query itself, so a
+        page costs one round trip; only a page past the end needs a separate count.
+        With `pagination.after` set the page is fetched by keyset (`id > last id`), so deep
+        pages cost the same as the first one, and the exact count is skipped: total_found is
+        the planner's row estimate when `estimate_total` is set and None otherwise.
+
+        `order_by` puts other sort keys (e.g. a relevance rank) before id; such pages only
+        support offset pagination.
+        """
+        rows = (await self.reader.execute(self.page_query(query, pagination, order_by))).all()
+        total = await self.page_total(query, pagination, rows, estimate_total)
+        next_cursor = self.next_cursor([row.id for row in rows], pagination, order_by)
+        return rows, total, next_cursor
+
+    def page_query(self, query, pagination: PaginationParams, order_by: tuple = ()):
+        """`query` cut down to one page; in offset mode it also carries a `total_found` column."""
+        if order_by and pagination.after is not None:
+            raise PaginationError("Cursor pagination is not available for ranked results")
+
+        page_query = query.order_by(*order_by, self.model.id).limit(pagination.per_page)
+        if pagination.after is None:
+            offset = (pagination.page - 1) * pagination.per_page
+            return page_query.add_columns(func.count().over().label("total_found")).offset(offset)
+
+        after_id = decode_cursor(pagination.after, self.model.id.type.python_type)
+        return page_query.filter(self.model.id > after_id)
+
+    async def page_total(self, query, pagination: PaginationParams, rows, estimate_total: bool = False):
+        """total_found for rows fetched with page_query(query, ...)."""
+        if pagination.after is not None:
+            return await self.estimate_count() if estimate_total else None
+        if rows:
+            return rows[0].total_found
+        if pagination.page > 1:
+            return await self.reader.scalar(select(func.count()).select_from(query.subquery()))
+        return 0
+
+    @staticmethod
+    def next_cursor(ids: list, pagination: PaginationParams, order_by: tuple = ()) -> str | None:
+        if order_by or len(ids) < pagination.per_page:
+            return None
+        return encode_cursor(ids[-1])
+
+    async def estimate_count(self) -> int | None:
+        """Planner's row estimate for the whole table; None until the table has been analyzed."""
+        query = text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table)")
+        estimate = await self.reader.scalar(query, {"table": self.model.__tablename__})
+        return estimate if estimate is not None and estimate >= 0 else None
@@ -1,11 +1,16 @@
 from datetime import date
 
-from sqlalchemy import select, func
+from sqlalchemy import Date, Integer, and_, column, select, values
 from pydantic import BaseModel
-from typing import List
+from sqlalchemy.engine import Row
+from typing import AsyncIterator, List
 
 from src.models.bookings_models import BookingsModel
-from src.schemas.bookings_schemas import BookingsPrintOut
+from src.models.occupancy_models import RoomOccupancyModel
+from src.models.rooms_models import RoomsModel
+from src.repo.occupancy_repo import RoomOccupancyRepository
+from src.schemas.bookings_schemas import Booking, BookingAdd, BookingResult, BookingsPrintOut
+from src.utils.availability import accept_stays
 from src.schemas.pagination import PaginationParams
 from src.repo.base import BaseRepository
 from src.schemas.hotels_schemas import HotelsPrintOut, PaginatedHotelsPrintOut
@@ -21,47 +26,168 @@ class BookingsRepository(BaseRepository):
     model = BookingsModel
     schema = BookingsPrintOut
 
-    async def get_all_bookings(self, pagination: PaginationParams):
-        total_query = select(func.count()).select_from(BookingsModel)
-        total = await self.session.scalar(total_query)
+    # Every write below keeps the room_occupancy ledger in sync within the same transaction.
+
+    def _stays(self, *filter):
+        return select(BookingsModel.room_id, BookingsModel.date_from, BookingsModel.date_to).filter(*filter)
+
+    async def _shift_occupancy(self, *filter, delta: int) -> None:
+        await RoomOccupancyRepository(self.session).shift(self._stays(*filter), delta)
+
+    async def add(self, model_instance: BaseModel):
+        booking_id = await super().add(model_instance)
+        await self._shift_occupancy(BookingsModel.id == booking_id, delta=1)
+        return booking_id
+
+    async def add_bulk(self, data: list[BaseModel]):
+        booking_ids = await super().add_bulk(data)
+        if not booking_ids:
+            return booking_ids
+        await self._shift_occupancy(BookingsModel.id.in_(booking_ids), delta=1)
+        return booking_ids
+
+    async def delete(self, id_):
+        await self._shift_occupancy(BookingsModel.id == id_, delta=-1)
+        return await super().delete(id_)
+
+    async def delete_where(self, **filters):
+        await self._shift_occupancy(*[getattr(BookingsModel, k) == v for k, v in filters.items()], delta=-1)
+        await super().delete_where(**filters)
+
+    async def update(self, id_, model_instance: BaseModel):
+        await self._shift_occupancy(BookingsModel.id == id_, delta=-1)
+        booking_id = await super().update(id_, model_instance)
+        await self._shift_occupancy(BookingsModel.id == id_, delta=1)
+        return booking_id
+
+    async def edit(self, id_, model_instance: BaseModel):
+        await self._shift_occupancy(BookingsModel.id == id_, delta=-1)
+        booking_id = await super().edit(id_, model_instance)
+        await self._shift_occupancy(BookingsModel.id == id_, delta=1)
+        return booking_id
+
+    async def book(self, user_id: int, bookings: list[Booking]) -> list[BookingResult]:
+        """
+        Creates the bookings that fit, in request order, and reports each one's outcome.
+
+        Availability of the whole batch is read in one statement: every requested room with
+        its quantity, price and the ledger nights of its requested window. The batch itself
+        is then checked night by night in Python (earlier items take units from later ones),
+        and the accepted bookings go in with a single multi-row insert.
+
+        The requested rooms are locked FOR UPDATE (in id order, so concurrent batches cannot
+        deadlock) until the caller commits. Concurrent bookings of the same room type thus run
+        one after another, while other rooms are booked in parallel. The availability read is a
+        separate statement issued after the lock is granted, so under READ COMMITTED it sees
+        every booking committed by the transaction that held the lock before.
+        """
+        windows: dict[int, tuple[date, date]] = {}
+        for booking in bookings:
+            window_from, window_to = windows.get(booking.room_id, (booking.date_from, booking.date_to))
+            windows[booking.room_id] = (min(window_from, booking.date_from), max(window_to, booking.date_to))
+
+        await self.session.execute(
+            select(RoomsModel.id)
+            .filter(RoomsModel.id.in_(windows))
+            .order_by(RoomsModel.id)
+            .with_for_update()
+        )
+
+        requested = values(
+            column("room_id", Integer), column("date_from", Date), column("date_to", Date), name="requested"
+        ).data([(room_id, *window) for room_id, window in windows.items()])
+        query = (
+            select(
+                RoomsModel.id,
+                RoomsModel.quantity,
+                RoomsModel.price_per_night,
+                RoomOccupancyModel.night,
+                RoomOccupancyModel.booked,
+            )
+            .select_from(RoomsModel)
+            .join(requested, requested.c.room_id == RoomsModel.id)
+            .outerjoin(RoomOccupancyModel, and_(
+                RoomOccupancyModel.room_id == RoomsModel.id,
+                RoomOccupancyModel.night >= requested.c.date_from,
+                RoomOccupancyModel.night < requested.c.date_to,
+                RoomOccupancyModel.booked > 0,
+            ))
+        )
+        rows = (await self.session.execute(query)).all()
+
+        quantities = {row.id: row.quantity for row in rows}
+        prices = {row.id: row.price_per_night for row in rows}
+        booked = {(row.id, row.night): row.booked for row in rows if row.night is not None}
+        accepted = accept_stays(
+            quantities, booked, [(booking.room_id, booking.date_from, booking.date_to) for booking in bookings]
+        )
 
-        offset = (pagination.page - 1) * pagination.per_page
-        query = select(BookingsModel).order_by(BookingsModel.id).offset(offset).limit(pagination.per_page)
-        result = await self.session.execute(query)
-        bookings = result.scalars().all()
+        booking_ids = iter(await self.add_bulk([
+            BookingAdd(**booking.model_dump(), user_id=user_id, price_per_night=prices[booking.room_id])
+            for booking, fits in zip(bookings, accepted) if fits
+        ]))
+        return [
+            BookingResult(
+                **booking.model_dump(),
+                status="created" if fits else "conflict" if booking.room_id in quantities else "room_not_found",
+                booking_id=next(booking_ids) if fits else None,
+            )
+            for booking, fits in zip(bookings, accepted)
+        ]
+
+    async def get_all_bookings(self, pagination: PaginationParams):
+        bookings, total, next_cursor = await self.get_paginated(pagination)
 
         return PaginatedBookingsPrintOut(
             page=pagination.page,
             per_page=pagination.per_page,
             total_found=total,
+            next_cursor=next_cursor,
             bookings=bookings,
         )
 
 
     async def get_bookings_current_user(self, user_id: int, pagination: PaginationParams):
-        total_query = select(func.count()).select_from(BookingsModel).where(BookingsModel.user_id == user_id)
-        total = await self.session.scalar(total_query)
-
-        offset = (pagination.page - 1) * pagination.per_page
-        query = select(BookingsModel).where(BookingsModel.user_id == user_id).order_by(BookingsModel.id).offset(offset).limit(pagination.per_page)
-        result = await self.session.execute(query)
-        bookings = result.scalars().all()
+        bookings, total, next_cursor = await self.get_paginated(pagination, BookingsModel.user_id == user_id)
 
         return PaginatedBookingsPrintOut(
             page=pagination.page,
             per_page=pagination.per_page,
             total_found=total,
-            bookings=[BookingsPrintOut.model_validate(b) for b in bookings],
+            next_cursor=next_cursor,
+            bookings=bookings,
         )
 
 
+    async def stream_bookings(
+            self,
+            date_from: date | None = None,
+            date_to: date | None = None,
+            hotel_id: int | None = None,
+            user_id: int | None = None,
+            batch_size: int = 5000,
+    ) -> AsyncIterator[list[Row]]:
+        """
+        Yields the matching bookings in batches of column rows, read through a server-side
+        cursor: memory stays at one batch however many bookings match.
+        With dates, bookings overlapping date_from ... date_to are selected.
+        """
+        query = select(*self.columns()).order_by(BookingsModel.date_from, BookingsModel.id)
+        if date_from is not None:
+            query = query.filter(BookingsModel.date_to > date_from)
+        if date_to is not None:
+            query = query.filter(BookingsModel.date_from < date_to)
+        if hotel_id is not None:
+            query = query.filter(BookingsModel.room_id.in_(select(RoomsModel.id).filter_by(hotel_id=hotel_id)))
+        if user_id is not None:
+            query = query.filter(BookingsModel.user_id == user_id)
+
+        result = await self.reader.stream(query.execution_options(yield_per=batch_size))
+        async for rows in result.partitions():
+            yield rows
+
     async def get_todays_checkins(self):
-        query = (
-            select(BookingsModel)
-            .filter(BookingsModel.date_from == date.today())
-        )
-        result = await self.session.execute(query)
-        bookings = result.scalars().all()
+        bookings = await self.get_filtered(BookingsModel.date_from == date.today())
         if bookings:
             return bookings
         else:
@@ -74,5 +200,6 @@ class PaginatedBookingsPrintOut(BaseModel):
     """
     page: int
     per_page: int
-    total_found: int
+    total_found: int | None = None
+    next_cursor: str | None = None
     bookings: List[BookingsPrintOut]
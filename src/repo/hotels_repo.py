@@ -1,15 +1,14 @@
 from datetime import date
 
-from sqlalchemy import select, func
+from sqlalchemy import select, func, tuple_
 
-from src.models.bookings_models import BookingsModel
 from src.schemas.pagination import PaginationParams
 from src.models.hotels_models import HotelsModel
 from src.models.rooms_models import RoomsModel
 from src.repo.base import BaseRepository
-from src.schemas.hotels_schemas import HotelsPrintOut, PaginatedHotelsPrintOut
+from src.schemas.hotels_schemas import Hotel, HotelsPrintOut, PaginatedHotelsPrintOut
 from src.schemas.rooms_schemas import Room
-from src.repo.utils import rooms_ids_for_booking
+from src.repo.utils import rooms_ids_for_booking, rooms_available_in_range
 
 
 class HotelsRepository(BaseRepository):
@@ -23,22 +22,35 @@ class HotelsRepository(BaseRepository):
     schema = HotelsPrintOut
 
     async def get_all_hotels(self, pagination: PaginationParams):
-        total_query = select(func.count()).select_from(HotelsModel)
-        total = await self.session.scalar(total_query)
-
-        offset = (pagination.page - 1) * pagination.per_page
-        query = select(HotelsModel).order_by(HotelsModel.id).offset(offset).limit(pagination.per_page)
-        result = await self.session.execute(query)
-        hotels = result.scalars().all()
+        hotels, total, next_cursor = await self.get_paginated(pagination)
 
         return PaginatedHotelsPrintOut(
             page=pagination.page,
             per_page=pagination.per_page,
             total_found=total,
+            next_cursor=next_cursor,
             hotels=hotels,
         )
 
 
+    async def get_or_add_ids(self, hotels: list[Hotel]) -> tuple[dict[tuple[str, str], int], int]:
+        """
+        Ids of `hotels` by (name, location), adding the ones that do not exist yet in a single
+        multi-row insert. Returns the ids and the number of hotels added.
+        """
+        keys = list(dict.fromkeys((hotel.name, hotel.location) for hotel in hotels))
+        query = (
+            select(HotelsModel.id, HotelsModel.name, HotelsModel.location)
+            .filter(tuple_(HotelsModel.name, HotelsModel.location).in_(keys))
+        )
+        ids = {(row.name, row.location): row.id for row in (await self.session.execute(query)).all()}
+
+        missing = [Hotel(name=name, location=location) for name, location in keys if (name, location) not in ids]
+        for hotel, hotel_id in zip(missing, await self.add_bulk(missing)):
+            ids[(hotel.name, hotel.location)] = hotel_id
+        return ids, len(missing)
+
+
     async def search_hotels(
             self,
             pagination: PaginationParams,
@@ -46,78 +58,72 @@ class HotelsRepository(BaseRepository):
             name: str = None,
             date_from: date = None,
             date_to: date = None,
+            fuzzy: bool = False,
         ):
-        query = select(HotelsModel)
-        if name:
-            query = query.where(HotelsModel.name.ilike(f"%{name}%"))
-        if location:
-            query = query.where(HotelsModel.location.ilike(f"%{location}%"))
-        if date_from and date_to:
-            rooms_ids_to_get = rooms_ids_for_booking(date_from=date_from, date_to=date_to)
-            hotels_ids_to_get = (
-                select(RoomsModel.hotel_id)
-                .select_from(RoomsModel)
-                .filter(RoomsModel.id.in_(rooms_ids_to_get))
+        """
+        Name/location filters are substring matches (ILIKE), or with `fuzzy` typo-tolerant
+        trigram matches ranked by word similarity. Both are served by the pg_trgm GIN indexes.
+        """
+        query = select(*self.columns())
+        rank = []
+        for column, value in ((HotelsModel.name, name), (HotelsModel.location, location)):
+            if not value:
+                continue
+            if fuzzy:
+                query = query.where(column.op("%>")(value))
+                rank.append(func.word_similarity(value, column))
+            else:
+                query = query.where(column.ilike(f"%{value}%"))
+        order_by = (sum(rank[1:], rank[0]).desc(),) if rank else ()
+
+        if not (date_from and date_to):
+            rows, total, next_cursor = await self.paginate(query, pagination, order_by=order_by)
+            if not rows:
+                return {"message": "No hotels found with your search criteria"}
+
+            return PaginatedHotelsPrintOut(
+                page=pagination.page,
+                per_page=pagination.per_page,
+                total_found=total,
+                next_cursor=next_cursor,
+                hotels=self.to_schemas(rows),
             )
-            query = query.where(HotelsModel.id.in_(hotels_ids_to_get))
-
-        count_query = select(func.count()).select_from(query.subquery())
-        total = await self.session.scalar(count_query)
 
-        query = query.offset((pagination.page - 1) * pagination.per_page).limit(pagination.per_page)
+        # Single pass: availability is computed once in the available_rooms CTE, which both
+        # filters the hotels and supplies the rooms of the page; the total rides along as a window count.
+        available_rooms = rooms_available_in_range(date_from=date_from, date_to=date_to)
+        query = query.where(HotelsModel.id.in_(select(available_rooms.c.hotel_id)))
 
-        result = await self.session.execute(query)
-        hotels = result.scalars().all()
+        hotels_page = (
+            self.page_query(query, pagination, order_by)
+            .add_columns(func.row_number().over(order_by=(*order_by, HotelsModel.id)).label("position"))
+            .cte(name="hotels_page")
+        )
+        page_query = (
+            select(hotels_page, *[column.label(f"room_{column.name}") for column in available_rooms.c])
+            .select_from(hotels_page)
+            .join(available_rooms, available_rooms.c.hotel_id == hotels_page.c.id)
+            .order_by(hotels_page.c.position, available_rooms.c.id)
+        )
+        rows = (await self.reader.execute(page_query)).all()
 
-        if not hotels:
+        if not rows:
             return {"message": "No hotels found with your search criteria"}
 
-        if date_from and date_to:
-            hotel_ids = [h.id for h in hotels]
-
-            rooms_count = (
-                select(BookingsModel.room_id, func.count("*").label("rooms_booked"))
-                .select_from(BookingsModel)
-                .filter(
-                    BookingsModel.date_from <= date_to,
-                    BookingsModel.date_to >= date_from,
-                )
-                .group_by(BookingsModel.room_id)
-                .cte(name="rooms_count")
-            )
-            rooms_left = (
-                RoomsModel.quantity - func.coalesce(rooms_count.c.rooms_booked, 0)
-            ).label("rooms_left")
-
-            rooms_query = (
-                select(RoomsModel, rooms_left)
-                .outerjoin(rooms_count, RoomsModel.id == rooms_count.c.room_id)
-                .filter(
-                    RoomsModel.hotel_id.in_(hotel_ids),
-                    rooms_left > 0,
-                )
-            )
-            rooms_result = await self.session.execute(rooms_query)
-            rooms_by_hotel: dict[int, list[Room]] = {}
-            for room, rl in rooms_result.all():
-                r = Room.model_validate({**room.__dict__, "rooms_left": rl})
-                rooms_by_hotel.setdefault(room.hotel_id, []).append(r)
-
-            hotels_out = [
-                HotelsPrintOut.model_validate({
-                    **h.__dict__,
-                    "rooms": rooms_by_hotel.get(h.id, []),
-                })
-                for h in hotels
-            ]
-        else:
-            hotels_out = hotels
+        hotels_out: dict[int, HotelsPrintOut] = {}
+        for row in rows:
+            row = row._mapping
+            hotel = hotels_out.get(row["id"])
+            if hotel is None:
+                hotel = hotels_out[row["id"]] = HotelsPrintOut(id=row["id"], name=row["name"], location=row["location"], rooms=[])
+            hotel.rooms.append(Room.model_validate({field: row[f"room_{field}"] for field in Room.model_fields}))
 
         return PaginatedHotelsPrintOut(
             page=pagination.page,
             per_page=pagination.per_page,
-            total_found=total,
-            hotels=hotels_out,
+            total_found=await self.page_total(query, pagination, rows),
+            next_cursor=self.next_cursor(list(hotels_out), pagination, order_by),
+            hotels=list(hotels_out.values()),
         )
 
 
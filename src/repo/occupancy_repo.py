@@ -0,0 +1,40 @@
+from sqlalchemy import select, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from src.models.occupancy_models import RoomOccupancyModel
+from src.repo.base import BaseRepository
+from src.schemas.occupancy_schemas import RoomOccupancy
+
+
+class RoomOccupancyRepository(BaseRepository):
+    model = RoomOccupancyModel
+    schema = RoomOccupancy
+
+    async def shift(self, stays, delta: int) -> None:
+        """
+        Adds `delta` booked units to every night of every stay in one statement.
+
+        `stays` is any selectable exposing room_id, date_from and date_to columns,
+        e.g. a select over bookings. Stays of the same room are summed per night,
+        so a single upsert never touches the same ledger row twice.
+        """
+        stays = stays.subquery(name="stays")
+        night_offset = func.generate_series(0, stays.c.date_to - stays.c.date_from - 1).column_valued("night_offset")
+        night = (stays.c.date_from + night_offset).label("night")
+
+        nights_query = (
+            select(
+                stays.c.room_id,
+                night,
+                (func.count() * delta).label("booked"),
+            )
+            .select_from(stays)
+            .group_by(stays.c.room_id, night)
+        )
+
+        stmt = pg_insert(self.model).from_select(["room_id", "night", "booked"], nights_query)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[self.model.room_id, self.model.night],
+            set_={"booked": self.model.booked + stmt.excluded.booked},
+        )
+        await self.session.execute(stmt)
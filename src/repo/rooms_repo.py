@@ -3,11 +3,10 @@ from datetime import date
 from sqlalchemy import select, func
 from sqlalchemy.orm import selectinload, joinedload
 
-from src.models.bookings_models import BookingsModel
 from src.models.rooms_models import RoomsModel
 from src.repo.base import BaseRepository
 from src.schemas.rooms_schemas import Room
-from src.repo.utils import rooms_ids_for_booking
+from src.repo.utils import rooms_ids_for_booking, rooms_booked_in_range
 
 
 class RoomsRepository(BaseRepository):
@@ -20,16 +19,7 @@ class RoomsRepository(BaseRepository):
             date_to: date | None = None,
             date_from: date | None = None,
         ):
-        rooms_count = (
-            select(BookingsModel.room_id, func.count("*").label("rooms_booked"))
-            .select_from(BookingsModel)
-            .filter(
-                BookingsModel.date_from <= date_to,
-                BookingsModel.date_to >= date_from,
-            )
-            .group_by(BookingsModel.room_id)
-            .cte(name="rooms_count")
-        )
+        rooms_count = rooms_booked_in_range(date_from=date_from, date_to=date_to)
 
         rooms_available = (
             select(
@@ -42,7 +32,8 @@ class RoomsRepository(BaseRepository):
         )
 
         query = (
-            select(RoomsModel, rooms_available.c.rooms_left)
+            select(*self.columns(), rooms_available.c.rooms_left)
+            .select_from(RoomsModel)
             .join(rooms_available, RoomsModel.id == rooms_available.c.room_id)
             .filter(
                 rooms_available.c.rooms_left > 0,
@@ -50,11 +41,8 @@ class RoomsRepository(BaseRepository):
             )
         )
 
-        result = await self.session.execute(query)
-        return [
-            Room.model_validate({**room.__dict__, "rooms_left": rooms_left})
-            for room, rooms_left in result.all()
-        ]
+        result = await self.reader.execute(query)
+        return self.to_schemas(result.all())
 
 
     async def get_filtered_by_time(
@@ -74,7 +62,7 @@ class RoomsRepository(BaseRepository):
             .filter(RoomsModel.id.in_(rooms_ids_to_get))
         )
 
-        result = await self.session.execute(query)
+        result = await self.reader.execute(query)
         return result.scalars().all()
 
 
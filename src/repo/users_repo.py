@@ -1,5 +1,5 @@
 from pydantic import EmailStr
-from sqlalchemy import select
+from sqlalchemy import select, update
 
 from src.models.users_models import UsersModel
 from src.repo.base import BaseRepository
@@ -17,3 +17,7 @@ class UsersRepository(BaseRepository):
         if model is None:
             return None
         return UserHashedPassword.model_validate(model)
+
+    async def update_hashed_password(self, user_id: int, hashed_password: str) -> None:
+        stmt = update(self.model).where(self.model.id == user_id).values(hashed_password=hashed_password)
+        await self.session.execute(stmt)
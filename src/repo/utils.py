@@ -1,28 +1,122 @@
 from datetime import date
 
-from sqlalchemy import select, func
-from sqlalchemy.orm import selectinload, joinedload
+from sqlalchemy import select, func, literal, union_all
 
 from src.models.bookings_models import BookingsModel
+from src.models.occupancy_models import RoomOccupancyModel
 from src.models.rooms_models import RoomsModel
 
 
-def rooms_ids_for_booking(
+def rooms_booked_in_range(
         date_from: date,
         date_to: date,
-        hotel_id: int | None = None,
 ):
-    rooms_count = (
-        select(BookingsModel.room_id, func.count("*").label("rooms_booked"))
-        .select_from(BookingsModel)
+    """
+    Peak number of booked units per room over the nights date_from ... date_to - 1.
+
+    Reads only the requested nights from the room_occupancy ledger, so the cost depends
+    on the window size and the number of rooms, not on the whole booking history.
+    """
+    return (
+        select(RoomOccupancyModel.room_id, func.max(RoomOccupancyModel.booked).label("rooms_booked"))
+        .select_from(RoomOccupancyModel)
         .filter(
-            BookingsModel.date_from <= date_to,
-            BookingsModel.date_to >= date_from,
+            RoomOccupancyModel.night >= date_from,
+            RoomOccupancyModel.night < date_to,
         )
-        .group_by(BookingsModel.room_id)
+        .group_by(RoomOccupancyModel.room_id)
         .cte(name="rooms_count")
     )
 
+
+def rooms_peak_occupancy(
+        date_from: date,
+        date_to: date,
+):
+    """
+    Same result as rooms_booked_in_range, computed straight from bookings with a sweep:
+    every stay clipped to the window becomes a +1 event on arrival and a -1 event on
+    departure, and the running sum of events per room gives the units occupied each night.
+    Back-to-back stays of one unit therefore count as one unit, not two.
+
+    Mirrors src.utils.availability.peak_occupancy, which runs the same sweep in Python.
+    """
+    date_to = max(date_from, date_to)
+    # Served by the GiST index on (room_id, daterange(date_from, date_to)).
+    overlapping = (
+        func.daterange(BookingsModel.date_from, BookingsModel.date_to).op("&&")(func.daterange(date_from, date_to)),
+    )
+    arrivals = (
+        select(
+            BookingsModel.room_id,
+            func.greatest(BookingsModel.date_from, date_from).label("day"),
+            literal(1).label("delta"),
+        )
+        .filter(*overlapping)
+    )
+    departures = (
+        select(
+            BookingsModel.room_id,
+            func.least(BookingsModel.date_to, date_to).label("day"),
+            literal(-1).label("delta"),
+        )
+        .filter(*overlapping)
+    )
+    events = union_all(arrivals, departures).cte(name="events")
+
+    deltas = (
+        select(events.c.room_id, events.c.day, func.sum(events.c.delta).label("delta"))
+        .group_by(events.c.room_id, events.c.day)
+        .cte(name="deltas")
+    )
+
+    occupied = (
+        select(
+            deltas.c.room_id,
+            func.sum(deltas.c.delta).over(partition_by=deltas.c.room_id, order_by=deltas.c.day).label("occupied"),
+        )
+        .cte(name="occupied")
+    )
+
+    return (
+        select(occupied.c.room_id, func.max(occupied.c.occupied).label("rooms_booked"))
+        .group_by(occupied.c.room_id)
+        .cte(name="rooms_count")
+    )
+
+
+def rooms_available_in_range(
+        date_from: date,
+        date_to: date,
+):
+    """Rooms with at least one unit free for the whole window, with their rooms_left."""
+    rooms_count = rooms_booked_in_range(date_from=date_from, date_to=date_to)
+    rooms_left = (RoomsModel.quantity - func.coalesce(rooms_count.c.rooms_booked, 0)).label("rooms_left")
+
+    return (
+        select(
+            RoomsModel.id,
+            RoomsModel.hotel_id,
+            RoomsModel.name,
+            RoomsModel.description,
+            RoomsModel.price_per_night,
+            RoomsModel.quantity,
+            rooms_left,
+        )
+        .select_from(RoomsModel)
+        .outerjoin(rooms_count, RoomsModel.id == rooms_count.c.room_id)
+        .filter(rooms_left > 0)
+        .cte(name="available_rooms")
+    )
+
+
+def rooms_ids_for_booking(
+        date_from: date,
+        date_to: date,
+        hotel_id: int | None = None,
+):
+    rooms_count = rooms_booked_in_range(date_from=date_from, date_to=date_to)
+
     rooms_available = (
         select(
             RoomsModel.id.label("room_id"),
@@ -23,7 +23,8 @@ class PaginatedAmenitiesPrintOut(BaseModel):
     """
     page: int
     per_page: int
-    total_found: int
+    total_found: int | None = None
+    next_cursor: str | None = None
     amenities: List[AmenitiesPrintOut]
 
 
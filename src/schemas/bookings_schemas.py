@@ -1,7 +1,8 @@
 from datetime import date
+from typing import Literal
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 
 class Booking(BaseModel):
@@ -9,6 +10,12 @@ class Booking(BaseModel):
     date_from: date
     date_to: date
 
+    @model_validator(mode="after")
+    def check_dates(self):
+        if self.date_to <= self.date_from:
+            raise ValueError("date_to must be later than date_from")
+        return self
+
 class BookingAdd(Booking):
     price_per_night: int
     user_id: int
@@ -29,3 +36,13 @@ class BookingsPrintOut(BaseModel):
     price_per_night: int
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class BookingsBulk(BaseModel):
+    bookings: list[Booking] = Field(min_length=1, max_length=500)
+
+
+class BookingResult(Booking):
+    """Outcome of one requested booking: created, or rejected because the room is full or missing."""
+    status: Literal["created", "conflict", "room_not_found"]
+    booking_id: UUID | None = None
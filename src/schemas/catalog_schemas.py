@@ -0,0 +1,38 @@
+from pydantic import BaseModel, Field, field_validator
+
+
+class CatalogRow(BaseModel):
+    """One room of a catalog import, with the hotel it belongs to (matched by name and location)."""
+    hotel_name: str = Field(min_length=1, max_length=100)
+    hotel_location: str = Field(min_length=1)
+    room_name: str = Field(min_length=1)
+    description: str | None = Field(None)
+    price_per_night: int = Field(ge=1)
+    quantity: int = Field(ge=1)
+    facility_ids: list[int] = Field(default_factory=list)
+    amenity_ids: list[int] = Field(default_factory=list)
+
+    @field_validator("description", mode="before")
+    @classmethod
+    def empty_description(cls, value):
+        return value or None
+
+    @field_validator("facility_ids", "amenity_ids", mode="before")
+    @classmethod
+    def split_ids(cls, value):
+        # CSV cells hold the ids as "1;2;3"
+        if isinstance(value, str):
+            return [item for item in value.replace(",", ";").split(";") if item.strip()]
+        return value or []
+
+
+class CatalogImportError(BaseModel):
+    line: int
+    error: str
+
+
+class CatalogImportReport(BaseModel):
+    rows: int = 0
+    hotels_created: int = 0
+    rooms_created: int = 0
+    errors: list[CatalogImportError] = Field(default_factory=list)
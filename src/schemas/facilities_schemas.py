@@ -19,7 +19,8 @@ class FacilitiesPrintOut(BaseModel):
 class PaginatedFacilitiesPrintOut(BaseModel):
     page: int
     per_page: int
-    total_found: int
+    total_found: int | None = None
+    next_cursor: str | None = None
     facilities: List[FacilitiesPrintOut]
 
 
@@ -40,5 +40,6 @@ class PaginatedHotelsPrintOut(BaseModel):
     """
     page: int
     per_page: int
-    total_found: int
+    total_found: int | None = None
+    next_cursor: str | None = None
     hotels: List[HotelsPrintOut]
@@ -0,0 +1,11 @@
+from datetime import date
+
+from pydantic import BaseModel, ConfigDict
+
+
+class RoomOccupancy(BaseModel):
+    room_id: int
+    night: date
+    booked: int
+
+    model_config = ConfigDict(from_attributes=True)
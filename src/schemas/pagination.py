@@ -1,8 +1,31 @@
+import base64
+import json
 from typing import Annotated
+
 from fastapi import Query
 from pydantic import BaseModel
 
 
+class PaginationError(ValueError):
+    """A page that cannot be fetched, e.g. a malformed cursor; the API answers it with 400."""
+
+
 class PaginationParams(BaseModel):
     page: Annotated[int | None, Query(1, ge=1, description="Page number")]
-    per_page: Annotated[int | None, Query(15, ge=1, lte=25, description="Results per page")]
\ No newline at end of file
+    per_page: Annotated[int | None, Query(15, ge=1, lte=25, description="Results per page")]
+    after: Annotated[str | None, Query(None, description="Cursor from `next_cursor` of the previous page; switches to keyset pagination and ignores `page`")]
+
+
+def encode_cursor(last_id) -> str:
+    """Opaque cursor pointing right after the row with `last_id`."""
+    payload = json.dumps({"id": last_id}, default=str).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, id_type: type):
+    """Returns the last seen id converted to `id_type`, or raises PaginationError for a malformed cursor."""
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        return id_type(json.loads(payload)["id"])
+    except (ValueError, KeyError, TypeError):
+        raise PaginationError("Invalid pagination cursor")
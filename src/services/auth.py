@@ -1,3 +1,9 @@
+import asyncio
+import hashlib
+import time
+import uuid
+from collections import OrderedDict
+
 import jwt
 
 from datetime import datetime, timedelta, timezone
@@ -6,19 +12,95 @@ from fastapi import HTTPException
 from passlib.context import CryptContext
 
 from src.config import settings
+from src.utils.offload import BoundedExecutor, QueueFull
+
+
+class ClaimsCache:
+    """
+    Bounded LRU of verified JWT claims keyed by the token's SHA-256 digest, so raw tokens are
+    not kept in memory. An entry is only served until the token's `exp`.
+    """
+
+    def __init__(self, maxsize: int = 10_000):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[bytes, dict] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def digest(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, digest: bytes) -> dict | None:
+        claims = self._entries.get(digest)
+        if claims is None or claims.get("exp", 0) <= time.time():
+            if claims is not None:
+                del self._entries[digest]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(digest)
+        self.hits += 1
+        return claims
+
+    def set(self, digest: bytes, claims: dict) -> None:
+        if "exp" not in claims or self.maxsize <= 0:
+            return
+        self._entries[digest] = claims
+        self._entries.move_to_end(digest)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def stats(self) -> dict:
+        return {"size": len(self._entries), "maxsize": self.maxsize, "hits": self.hits, "misses": self.misses}
 
 
 class AuthService:
+    """
+    Password hashing and JWT handling. The app shares one instance (src.init.auth_service),
+    so its claims cache serves every request of the worker.
+
+    Without `password_hasher` the async hashing methods use the loop's default executor.
+    """
 
-    pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    # min_rounds marks hashes made with a lower work factor as needing an update
+    pwd_context = CryptContext(
+        schemes=["bcrypt"],
+        deprecated="auto",
+        bcrypt__default_rounds=settings.BCRYPT_ROUNDS,
+        bcrypt__min_rounds=settings.BCRYPT_ROUNDS,
+    )
+
+    def __init__(self, password_hasher: BoundedExecutor | None = None, claims_cache_size: int = 0):
+        self.password_hasher = password_hasher
+        self.claims_cache = ClaimsCache(claims_cache_size)
 
     def verify_password(self, plain_password, hashed_password):
         return self.pwd_context.verify(plain_password, hashed_password)
 
+    async def _offload(self, func, *args):
+        if self.password_hasher is None:
+            return await asyncio.to_thread(func, *args)
+        try:
+            return await self.password_hasher.run(func, *args)
+        except QueueFull:
+            raise HTTPException(status_code=503, detail="Too many logins in progress", headers={"Retry-After": "1"})
+
+    async def hash_password_async(self, password: str) -> str:
+        """hash_password in the password hasher's thread pool, off the event loop."""
+        return await self._offload(self.pwd_context.hash, password)
+
+    async def verify_and_update_async(self, plain_password: str, hashed_password: str) -> tuple[bool, str | None]:
+        """
+        Verifies the password off the event loop. Returns (verified, new hash), where the new
+        hash is set when the stored one uses an outdated scheme or fewer than BCRYPT_ROUNDS.
+        """
+        return await self._offload(self.pwd_context.verify_and_update, plain_password, hashed_password)
+
     def create_access_token(self, data: dict) -> str:
         to_encode = data.copy()
         expire = datetime.now(timezone.utc) + timedelta(minutes=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES)
-        to_encode.update({"exp": expire})
+        # jti identifies the token for revocation (log out)
+        to_encode.update({"exp": expire, "jti": uuid.uuid4().hex})
         encoded_jwt = jwt.encode(to_encode, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
         return encoded_jwt
 
@@ -26,7 +108,16 @@ class AuthService:
         return self.pwd_context.hash(password)
 
     def decode_token(self, token: str) -> dict:
+        """Verified claims of `token`; a token seen before is served from the claims cache until it expires."""
+        digest = self.claims_cache.digest(token)
+        claims = self.claims_cache.get(digest)
+        if claims is not None:
+            return claims
         try:
-            return jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
-        except jwt.exceptions.DecodeError:
+            claims = jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
+        except jwt.exceptions.ExpiredSignatureError:
+            raise HTTPException(status_code=401, detail="Access token expired")
+        except jwt.exceptions.InvalidTokenError:
             raise HTTPException(status_code=401, detail="Invalid access token")
+        self.claims_cache.set(digest, claims)
+        return claims
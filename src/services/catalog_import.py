@@ -0,0 +1,141 @@
+import csv
+import json
+from typing import Iterable, Iterator, Literal
+
+from pydantic import ValidationError
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.schemas.amenities_schemas import RoomAmenityAdd
+from src.schemas.catalog_schemas import CatalogImportError, CatalogImportReport, CatalogRow
+from src.schemas.facilities_schemas import RoomFacilityAdd
+from src.schemas.hotels_schemas import Hotel
+from src.schemas.rooms_schemas import RoomCreateInternal
+from src.utils.db_manager import DBManager
+
+CatalogFormat = Literal["jsonl", "csv"]
+
+Record = tuple[int, dict | str]  # (line number, raw row or the reason it could not be parsed)
+
+
+def read_records(lines: Iterable[str], catalog_format: CatalogFormat) -> Iterator[Record]:
+    """Raw rows of a JSON Lines or CSV (with a header line) catalog, read lazily line by line."""
+    if catalog_format == "csv":
+        reader = csv.DictReader(lines)
+        for row in reader:
+            if None in row:
+                yield reader.line_num, "more cells than header columns"
+            else:
+                yield reader.line_num, row
+        return
+
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError as exc:
+            yield line_number, f"invalid JSON: {exc.msg}"
+            continue
+        yield line_number, row if isinstance(row, dict) else "expected a JSON object"
+
+
+def describe(exc: ValidationError) -> str:
+    return "; ".join(f"{'.'.join(map(str, error['loc']))}: {error['msg']}" for error in exc.errors())
+
+
+class CatalogImporter:
+    """
+    Loads hotels and their rooms from catalog rows in batches of `batch_size`.
+
+    Rows are validated one by one; each batch is then written with one multi-row insert per
+    table (hotels, rooms, room_facilities, room_amenities) and committed on its own, so a
+    failing batch only loses its own rows. Hotels are matched by name and location, reusing
+    existing ones. Every rejected row is reported with its line number. `hotel_ids` collects
+    the hotels that got rooms in committed batches, for cache invalidation.
+    """
+
+    def __init__(self, db: DBManager, batch_size: int = 1000):
+        self.db = db
+        self.batch_size = batch_size
+        self.report = CatalogImportReport()
+        self.hotel_ids: set[int] = set()
+
+    def _reject(self, line: int, error: str) -> None:
+        self.report.errors.append(CatalogImportError(line=line, error=error))
+
+    async def run(self, records: Iterable[Record]) -> CatalogImportReport:
+        batch: list[tuple[int, CatalogRow]] = []
+        for line, record in records:
+            self.report.rows += 1
+            if isinstance(record, str):
+                self._reject(line, record)
+                continue
+            try:
+                batch.append((line, CatalogRow.model_validate(record)))
+            except ValidationError as exc:
+                self._reject(line, describe(exc))
+                continue
+            if len(batch) >= self.batch_size:
+                await self._write(batch)
+                batch = []
+        if batch:
+            await self._write(batch)
+        return self.report
+
+    @staticmethod
+    async def _known_ids(repository, ids: set[int]) -> set[int]:
+        if not ids:
+            return set()
+        return {item.id for item in await repository.get_filtered(repository.model.id.in_(ids))}
+
+    async def _write(self, batch: list[tuple[int, CatalogRow]]) -> None:
+        # Unknown facility/amenity ids would fail the whole batch on the foreign keys: reject those rows
+        facilities = await self._known_ids(self.db.facilities, {id_ for _, row in batch for id_ in row.facility_ids})
+        amenities = await self._known_ids(self.db.amenities, {id_ for _, row in batch for id_ in row.amenity_ids})
+        valid = []
+        for line, row in batch:
+            unknown_facilities = sorted(set(row.facility_ids) - facilities)
+            unknown_amenities = sorted(set(row.amenity_ids) - amenities)
+            if unknown_facilities:
+                self._reject(line, f"unknown facility ids: {unknown_facilities}")
+            elif unknown_amenities:
+                self._reject(line, f"unknown amenity ids: {unknown_amenities}")
+            else:
+                valid.append((line, row))
+        if not valid:
+            return
+
+        try:
+            hotel_ids, hotels_created = await self.db.hotels.get_or_add_ids(
+                [Hotel(name=row.hotel_name, location=row.hotel_location) for _, row in valid]
+            )
+            room_ids = await self.db.rooms.add_bulk([
+                RoomCreateInternal(
+                    hotel_id=hotel_ids[(row.hotel_name, row.hotel_location)],
+                    name=row.room_name,
+                    description=row.description,
+                    price_per_night=row.price_per_night,
+                    quantity=row.quantity,
+                )
+                for _, row in valid
+            ])
+            await self.db.room_facilities.add_bulk([
+                RoomFacilityAdd(room_id=room_id, facility_id=facility_id)
+                for room_id, (_, row) in zip(room_ids, valid)
+                for facility_id in dict.fromkeys(row.facility_ids)
+            ])
+            await self.db.room_amenities.add_bulk([
+                RoomAmenityAdd(room_id=room_id, amenity_id=amenity_id)
+                for room_id, (_, row) in zip(room_ids, valid)
+                for amenity_id in dict.fromkeys(row.amenity_ids)
+            ])
+            await self.db.commit()
+        except SQLAlchemyError as exc:
+            await self.db.session.rollback()
+            for line, _ in valid:
+                self._reject(line, f"batch not saved: {exc.__class__.__name__}")
+            return
+
+        self.report.hotels_created += hotels_created
+        self.report.rooms_created += len(room_ids)
+        self.hotel_ids.update(hotel_ids.values())
@@ -0,0 +1,133 @@
+from datetime import date
+
+from pydantic_core import to_json
+
+from src.init import search_cache
+from src.schemas.hotels_schemas import PaginatedHotelsPrintOut
+from src.schemas.pagination import PaginationParams
+from src.services.search_cache import HOTELS_SEARCH_TAG, SearchCache, hotel_tag, room_tag
+from src.utils.db_manager import DBManager
+
+
+def encode(result) -> bytes:
+    return to_json(result)
+
+
+class SearchService:
+    """
+    Cached read paths behind /hotels/search, /hotels/{hotel_id}/rooms/search and /hotels/{hotel_id}.
+
+    Every method returns the JSON response body; on a cache miss it is computed from the
+    repositories (once per key, however many requests miss concurrently) and stored tagged
+    with the hotels and rooms it contains.
+
+    A computation is shared by every request coalesced on its key, so it runs in a DBManager
+    of its own (see `_unit_of_work`) rather than in the first request's, which is closed as
+    soon as that request ends or its client disconnects. It reads from the primary: writes
+    invalidate the cache right after committing there, and a result recomputed from a lagging
+    replica would pass the generation check and be cached stale for the whole expiry.
+
+    With `track` the searches count towards the cache's popular searches, which `warm`
+    recomputes ahead of the requests.
+    """
+
+    def __init__(self, db: DBManager, cache: SearchCache = search_cache, track: bool = True):
+        self.db = db
+        self.cache = cache
+        self.track = track
+
+    def _unit_of_work(self) -> DBManager:
+        return DBManager(session_factory=self.db.session_factory)
+
+    async def _get_or_compute(self, namespace: str, params: dict, compute) -> bytes | None:
+        key = self.cache.key(namespace, **params)
+        track = self.cache.member(namespace, **params) if self.track else None
+        return await self.cache.get_or_compute(key, compute, track=track)
+
+    async def search_hotels(
+            self,
+            pagination: PaginationParams,
+            location: str | None = None,
+            name: str | None = None,
+            date_from: date | None = None,
+            date_to: date | None = None,
+            fuzzy: bool = False,
+    ) -> bytes:
+        filters = dict(location=location, name=name, date_from=date_from, date_to=date_to, fuzzy=fuzzy)
+
+        async def compute():
+            async with self._unit_of_work() as db:
+                result = await db.hotels.search_hotels(pagination, **filters)
+            tags = [HOTELS_SEARCH_TAG]
+            if isinstance(result, PaginatedHotelsPrintOut):
+                for hotel in result.hotels:
+                    tags.append(hotel_tag(hotel.id))
+                    tags += [room_tag(room.id) for room in hotel.rooms or []]
+            return encode(result), tags
+
+        return await self._get_or_compute("hotels_search", pagination.model_dump() | filters, compute)
+
+    async def search_rooms(
+            self,
+            hotel_id: int,
+            date_from: date | None = None,
+            date_to: date | None = None,
+    ) -> bytes:
+        async def compute():
+            async with self._unit_of_work() as db:
+                rooms = await db.rooms.search_rooms(hotel_id=hotel_id, date_from=date_from, date_to=date_to)
+            return encode(rooms), [hotel_tag(hotel_id), *[room_tag(room.id) for room in rooms]]
+
+        params = dict(hotel_id=hotel_id, date_from=date_from, date_to=date_to)
+        return await self._get_or_compute("rooms_search", params, compute)
+
+    async def get_hotel(self, hotel_id: int) -> bytes | None:
+        """Hotel with all its rooms, or None if the hotel does not exist (not cached)."""
+        async def compute():
+            async with self._unit_of_work() as db:
+                hotel = await db.hotels.get_one_or_none(id=hotel_id)
+                if not hotel:
+                    return None
+                rooms = await db.rooms.get_filtered(hotel_id=hotel_id)
+            payload = encode({"hotel": hotel, "rooms": rooms})
+            return payload, [hotel_tag(hotel_id), *[room_tag(room.id) for room in rooms]]
+
+        return await self._get_or_compute("hotel", dict(hotel_id=hotel_id), compute)
+
+    async def _replay(self, namespace: str, params: dict) -> None:
+        for name in ("date_from", "date_to"):
+            if name in params:
+                params[name] = date.fromisoformat(params[name])
+        if namespace == "hotels_search":
+            pagination = PaginationParams(**{name: params.pop(name) for name in list(params) if name in PaginationParams.model_fields})
+            await self.search_hotels(pagination, **params)
+        elif namespace == "rooms_search":
+            await self.search_rooms(**params)
+        elif namespace == "hotel":
+            await self.get_hotel(**params)
+
+    async def warm(self, budget: int, candidates: int) -> dict:
+        """
+        Computes into the cache the most popular of the `candidates` top searches that are not
+        cached, at most `budget` of them. Searches starting in the past are skipped.
+        """
+        popular = await self.cache.popular(candidates)
+        cached = await self.cache.cached([self.cache.key(namespace, **params) for namespace, params in popular])
+        today = date.today().isoformat()
+        report = {"candidates": len(popular), "cached": sum(cached), "computed": 0, "skipped": 0}
+        for (namespace, params), is_cached in zip(popular, cached):
+            if is_cached:
+                continue
+            if report["computed"] >= budget:
+                break
+            if params.get("date_from", today) < today:
+                report["skipped"] += 1
+                continue
+            try:
+                await self._replay(namespace, params)
+            except ValueError:
+                # Searches the endpoint rejects (e.g. a bad cursor) are tracked too
+                report["skipped"] += 1
+                continue
+            report["computed"] += 1
+        return report
@@ -0,0 +1,314 @@
+import asyncio
+import hashlib
+import json
+import logging
+import time
+import uuid
+from typing import Awaitable, Callable, Iterable
+
+from redis.exceptions import RedisError
+
+from src.connectors.redis_connector import RedisConnector
+from src.utils.single_flight import SingleFlight, should_refresh_early
+
+logger = logging.getLogger(__name__)
+
+
+# Tag of every hotel search entry: invalidated by writes that can add hotels to a search result
+HOTELS_SEARCH_TAG = "hotels"
+
+# Deletes the lock only if it still holds our token, so an expired lock taken over by another
+# worker is not released by us
+RELEASE_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+# Writes an entry and adds it to its tag sets, unless one of its tags was invalidated after the
+# computation started: KEYS = entry, tag sets..., tag generations...; ARGV = generation read
+# before computing (-1 skips the check), payload, expire. Returns 1 if written.
+SET_IF_CURRENT_SCRIPT = """
+local tags = (#KEYS - 1) / 2
+local started = tonumber(ARGV[1])
+if started >= 0 then
+    for i = 1, tags do
+        if tonumber(redis.call('GET', KEYS[1 + tags + i]) or '0') > started then
+            return 0
+        end
+    end
+end
+redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3])
+for i = 1, tags do
+    redis.call('SADD', KEYS[1 + i], KEYS[1])
+    redis.call('EXPIRE', KEYS[1 + i], ARGV[3])
+end
+return 1
+"""
+
+# Stamps tags with a new generation, then pops their tag sets: KEYS = global generation, tag
+# generations..., tag sets...; ARGV = expire. Returns the keys of the tagged entries.
+INVALIDATE_SCRIPT = """
+local tags = (#KEYS - 1) / 2
+local generation = redis.call('INCR', KEYS[1])
+local keys = {}
+for i = 1, tags do
+    redis.call('SET', KEYS[1 + i], generation, 'EX', ARGV[1])
+    for _, key in ipairs(redis.call('SMEMBERS', KEYS[1 + tags + i])) do
+        table.insert(keys, key)
+    end
+    redis.call('DEL', KEYS[1 + tags + i])
+end
+return keys
+"""
+
+Compute = Callable[[], Awaitable[tuple[bytes, Iterable[str]] | None]]
+
+
+def hotel_tag(hotel_id: int) -> str:
+    return f"hotel:{hotel_id}"
+
+
+def room_tag(room_id: int) -> str:
+    return f"room:{room_id}"
+
+
+class SearchCache:
+    """
+    Redis cache for search responses.
+
+    Entries are keyed by the endpoint namespace and its normalized query params, and tagged
+    with the hotels/rooms the response was built from. Writes invalidate the tags they touch,
+    which drops exactly the entries depending on them. Without a Redis connection (or on Redis
+    errors) every lookup is a miss and writes are no-ops, so callers fall back to Postgres.
+
+    `get_or_compute` protects Postgres from stampedes on hot keys: concurrent misses in a worker
+    share one computation, with `lock_timeout` set a Redis lock extends that across workers,
+    and entries are refreshed early (XFetch) by a single request before they expire.
+
+    A computation can race a write: it reads the data before the write commits and stores it
+    after the write's `invalidate`. Every invalidation therefore bumps a global generation
+    and stamps each of its tags with it; `set` skips entries with a tag stamped after the
+    generation read before computing, so they are recomputed on the next lookup.
+
+    Lookups made with a `track` member count towards the `popular` searches, a sorted set the
+    warmup task (warm_search_cache) recomputes into the cache ahead of the requests.
+    """
+
+    def __init__(
+            self,
+            redis_connector: RedisConnector,
+            prefix: str = "search",
+            expire: int = 300,
+            lock_timeout: float | None = None,
+            beta: float = 1.0,
+    ):
+        self.redis_connector = redis_connector
+        self.prefix = prefix
+        self.expire = expire
+        self.lock_timeout = lock_timeout
+        self.beta = beta
+        self.single_flight = SingleFlight()
+        self.early_refreshes = 0
+        self.stale_writes_skipped = 0
+
+    @property
+    def available(self) -> bool:
+        return self.redis_connector.redis is not None
+
+    @staticmethod
+    def _normalize(params: dict) -> dict:
+        return {name: value for name, value in params.items() if value is not None}
+
+    def key(self, namespace: str, **params) -> str:
+        normalized = json.dumps(self._normalize(params), sort_keys=True, default=str)
+        digest = hashlib.sha1(normalized.encode()).hexdigest()
+        return f"{self.prefix}:{namespace}:{digest}"
+
+    def member(self, namespace: str, **params) -> str:
+        """Popularity set member of a search: unlike the key it keeps the params, so it can be replayed."""
+        return json.dumps({"namespace": namespace, "params": self._normalize(params)}, sort_keys=True, default=str)
+
+    @property
+    def _popular_key(self) -> str:
+        return f"{self.prefix}:popular"
+
+    def _tag_key(self, tag: str) -> str:
+        return f"{self.prefix}:tag:{tag}"
+
+    def _generation_key(self, tag: str | None = None) -> str:
+        return f"{self.prefix}:gen:{tag}" if tag else f"{self.prefix}:gen"
+
+    async def generation(self) -> int | None:
+        """Current invalidation generation; pass it to `set` for a computation starting now."""
+        if not self.available:
+            return None
+        try:
+            return int(await self.redis_connector.get(self._generation_key()) or 0)
+        except RedisError:
+            logger.warning("Search cache generation read failed", exc_info=True)
+            return None
+
+    def _lock_key(self, key: str) -> str:
+        return f"{self.prefix}:lock:{key}"
+
+    async def _read(self, key: str, track: str | None = None) -> tuple[bytes, float, float] | None:
+        """(payload, compute seconds, seconds until expiry) of a cached entry; counts a `track` lookup."""
+        if not self.available:
+            return None
+        try:
+            async with self.redis_connector.pipeline() as pipe:
+                pipe.get(key).pttl(key)
+                if track:
+                    pipe.zincrby(self._popular_key, 1, track)
+                raw, pttl, *_ = await pipe.execute()
+        except RedisError:
+            logger.warning("Search cache read failed for %s", key, exc_info=True)
+            return None
+        if raw is None:
+            return None
+        delta_ms, payload = raw.split(b":", 1)
+        return payload, int(delta_ms) / 1000, max(pttl, 0) / 1000
+
+    async def get(self, key: str) -> bytes | None:
+        entry = await self._read(key)
+        return entry[0] if entry else None
+
+    async def set(
+            self,
+            key: str,
+            payload: bytes,
+            tags: Iterable[str],
+            delta: float = 0.0,
+            generation: int | None = None,
+    ) -> None:
+        """
+        Stores the entry with its tags in one round trip. With the `generation` read before
+        computing it, the entry is skipped if any of its tags was invalidated since.
+        """
+        if not self.available:
+            return
+        tags = list(set(tags))
+        try:
+            # Compute time travels with the payload for the early refresh decision
+            written = await self.redis_connector.redis.eval(
+                SET_IF_CURRENT_SCRIPT,
+                1 + 2 * len(tags),
+                key,
+                *[self._tag_key(tag) for tag in tags],
+                *[self._generation_key(tag) for tag in tags],
+                -1 if generation is None else generation,
+                b"%d:" % round(delta * 1000) + payload,
+                self.expire,
+            )
+            if not written:
+                self.stale_writes_skipped += 1
+        except RedisError:
+            logger.warning("Search cache write failed for %s", key, exc_info=True)
+
+    async def invalidate(self, *tags: str) -> None:
+        """
+        Drops the entries of `tags` in two round trips however many tags and entries there are:
+        one script stamps the tags with a new generation (so in-flight computations that read
+        the data before this write do not store it afterwards) and pops their tag sets, then
+        the entries are deleted at once.
+        """
+        if not self.available or not tags:
+            return
+        tags = list(set(tags))
+        try:
+            # Stamps live as long as entries: an entry computed before a stamp expired with it
+            keys = await self.redis_connector.redis.eval(
+                INVALIDATE_SCRIPT,
+                1 + 2 * len(tags),
+                self._generation_key(),
+                *[self._generation_key(tag) for tag in tags],
+                *[self._tag_key(tag) for tag in tags],
+                self.expire,
+            )
+            await self.redis_connector.delete_many(set(keys))
+        except RedisError:
+            logger.warning("Search cache invalidation failed for %s", tags, exc_info=True)
+
+    async def cached(self, keys: list[str]) -> list[bool]:
+        """Whether each of `keys` has a cached entry, in one round trip."""
+        if not self.available:
+            return [False] * len(keys)
+        return [raw is not None for raw in await self.redis_connector.mget(keys)]
+
+    async def popular(self, limit: int, keep: int = 1000, decay: float = 0.5) -> list[tuple[str, dict]]:
+        """
+        The `limit` most looked-up searches as (namespace, params), most popular first.
+
+        Each call then multiplies all counts by `decay`, so searches that stopped being made
+        (e.g. for past dates) fade out, and drops all but the top `keep` searches.
+        """
+        if not self.available:
+            return []
+        async with self.redis_connector.pipeline() as pipe:
+            pipe.zrevrange(self._popular_key, 0, limit - 1)
+            pipe.zremrangebyrank(self._popular_key, 0, -keep - 1)
+            pipe.zunionstore(self._popular_key, {self._popular_key: decay})
+            members, *_ = await pipe.execute()
+        return [(entry["namespace"], entry["params"]) for entry in map(json.loads, members)]
+
+    async def get_or_compute(self, key: str, compute: Compute, track: str | None = None) -> bytes | None:
+        """
+        Cached payload for `key`, or the payload `compute` returns along with its tags.
+        A `compute` returning None (e.g. not found) is passed through and not cached.
+        `track` (see `member`) counts the lookup towards the popular searches.
+        """
+        entry = await self._read(key, track)
+        if entry is not None:
+            payload, delta, ttl = entry
+            if self.single_flight.in_flight(key) or not should_refresh_early(delta, ttl, self.beta):
+                return payload
+            self.early_refreshes += 1
+        return await self.single_flight.do(key, lambda: self._compute_locked(key, compute))
+
+    async def _compute_locked(self, key: str, compute: Compute) -> bytes | None:
+        if not self.lock_timeout or not self.available:
+            return await self._compute(key, compute)
+
+        token = uuid.uuid4().hex
+        lock_key = self._lock_key(key)
+        try:
+            acquired = await self.redis_connector.redis.set(
+                lock_key, token, nx=True, px=int(self.lock_timeout * 1000)
+            )
+        except RedisError:
+            logger.warning("Search cache lock failed for %s", key, exc_info=True)
+            return await self._compute(key, compute)
+
+        if not acquired:
+            # Another worker computes it: wait for its result, computing ourselves if it never lands
+            payload = await self._wait_for(key)
+            return payload if payload is not None else await self._compute(key, compute)
+
+        try:
+            return await self._compute(key, compute)
+        finally:
+            try:
+                await self.redis_connector.redis.eval(RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+            except RedisError:
+                logger.warning("Search cache unlock failed for %s", key, exc_info=True)
+
+    async def _wait_for(self, key: str, poll_interval: float = 0.05) -> bytes | None:
+        deadline = time.monotonic() + self.lock_timeout
+        while time.monotonic() < deadline:
+            payload = await self.get(key)
+            if payload is not None:
+                return payload
+            await asyncio.sleep(poll_interval)
+        return None
+
+    async def _compute(self, key: str, compute: Compute) -> bytes | None:
+        generation = await self.generation()
+        started = time.perf_counter()
+        result = await compute()
+        if result is None:
+            return None
+        payload, tags = result
+        await self.set(key, payload, tags, delta=time.perf_counter() - started, generation=generation)
+        return payload
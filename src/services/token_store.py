@@ -0,0 +1,128 @@
+import asyncio
+import logging
+import math
+import time
+
+from redis.exceptions import RedisError
+
+from src.connectors.redis_connector import RedisConnector
+from src.utils.bloom import BloomFilter
+
+logger = logging.getLogger(__name__)
+
+
+class TokenRevocations:
+    """
+    Revoked access tokens (by their `jti` claim), shared by all workers through Redis.
+
+    Each revocation is a Redis key living until the token would have expired anyway. Every
+    worker also keeps a bloom filter of revoked ids, fed by `listen` over pub/sub, so the
+    per-request check of a valid token costs no Redis round trip: only bloom hits (revoked
+    tokens and rare false positives) are confirmed in Redis. Bloom hits that cannot be
+    confirmed (no Redis) count as revoked.
+    """
+
+    def __init__(
+            self,
+            redis_connector: RedisConnector,
+            prefix: str = "auth:revoked",
+            channel: str = "auth:revoked",
+            capacity: int = 100_000,
+            error_rate: float = 0.001,
+    ):
+        self.redis_connector = redis_connector
+        self.prefix = prefix
+        self.channel = channel
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self._bloom = BloomFilter(capacity, error_rate)
+        self.checks = 0
+        self.bloom_hits = 0
+        self.revoked_hits = 0
+
+    @property
+    def redis(self):
+        return self.redis_connector.redis
+
+    def _key(self, jti: str) -> str:
+        return f"{self.prefix}:{jti}"
+
+    async def revoke(self, jti: str, expires_at: float) -> None:
+        ttl = math.ceil(expires_at - time.time())
+        if ttl <= 0:
+            return
+        self._bloom.add(jti.encode())
+        if self.redis is None:
+            return
+        try:
+            await self.redis_connector.set(self._key(jti), 1, expire=ttl)
+            await self.redis.publish(self.channel, jti)
+        except RedisError:
+            logger.warning("Token revocation failed for %s", jti, exc_info=True)
+
+    async def is_revoked(self, jti: str) -> bool:
+        self.checks += 1
+        if jti.encode() not in self._bloom:
+            return False
+        self.bloom_hits += 1
+        if self.redis is None:
+            return True
+        try:
+            revoked = bool(await self.redis.exists(self._key(jti)))
+        except RedisError:
+            logger.warning("Token revocation check failed for %s", jti, exc_info=True)
+            return True
+        self.revoked_hits += revoked
+        return revoked
+
+    async def rebuild(self) -> None:
+        """
+        Rebuilds the bloom filter from Redis, dropping revocations that have expired since.
+        The filter is sized for twice the revocations found (at least `capacity`), so it is
+        not full again right away when more are live than `capacity`.
+        """
+        if self.redis is None:
+            return
+        jtis = [key[len(self.prefix) + 1:] async for key in self.redis.scan_iter(match=f"{self.prefix}:*")]
+        bloom = BloomFilter(max(self.capacity, 2 * len(jtis)), self.error_rate)
+        for jti in jtis:
+            bloom.add(jti)
+        self._bloom = bloom
+
+    async def load(self) -> None:
+        """Initial rebuild, awaited before the app serves requests so no revoked token slips through."""
+        try:
+            await self.rebuild()
+        except RedisError:
+            logger.warning("Loading revoked tokens failed, the listener will retry", exc_info=True)
+
+    async def listen(self) -> None:
+        """Adds revocations published by any worker to the local filter. Runs until cancelled."""
+        if self.redis is None:
+            return
+        while True:
+            pubsub = self.redis.pubsub()
+            try:
+                await pubsub.subscribe(self.channel)
+                # Messages published while unsubscribed are lost, so start from what Redis holds
+                await self.rebuild()
+                async for message in pubsub.listen():
+                    if message["type"] != "message":
+                        continue
+                    self._bloom.add(message["data"])
+                    if self._bloom.full:
+                        await self.rebuild()
+            except RedisError:
+                logger.warning("Token revocation listener lost Redis, retrying", exc_info=True)
+                await asyncio.sleep(1)
+            finally:
+                await pubsub.aclose()
+
+    def stats(self) -> dict:
+        return {
+            "bloom_size": self._bloom.count,
+            "bloom_capacity": self._bloom.capacity,
+            "checks": self.checks,
+            "bloom_hits": self.bloom_hits,
+            "revoked_hits": self.revoked_hits,
+        }
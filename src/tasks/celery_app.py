@@ -14,5 +14,9 @@ celery_instance.conf.beat_schedule = {
     "notifications": {
         "task": "notify_today_checkins",
         "schedule": 10
+    },
+    "search_cache_warmup": {
+        "task": "warm_search_cache",
+        "schedule": settings.SEARCH_WARMUP_INTERVAL
     }
 }
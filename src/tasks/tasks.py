@@ -6,6 +6,8 @@ from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
 from src.config import settings
 from src.database import async_session_maker_null_pool
+from src.init import redis_connector
+from src.services.search import SearchService
 from src.tasks.celery_app import celery_instance
 from src.utils.db_manager import DBManager
 
@@ -41,4 +43,24 @@ async def get_todays_checkins_helper():
 
 @celery_instance.task(name="notify_today_checkins")
 def notify_today_checkins():
-    asyncio.run(get_todays_checkins_helper())
\ No newline at end of file
+    asyncio.run(get_todays_checkins_helper())
+
+
+async def warm_search_cache_helper():
+    # Each task runs in a fresh event loop, so it opens and closes its own Redis connections
+    await redis_connector.connect()
+    try:
+        async with DBManager(session_factory=async_session_maker_null_pool) as db:
+            report = await SearchService(db, track=False).warm(
+                budget=settings.SEARCH_WARMUP_BUDGET,
+                candidates=settings.SEARCH_WARMUP_CANDIDATES,
+            )
+    finally:
+        await redis_connector.disconnect()
+    print(f"Search cache warmup: {report}")
+    return report
+
+
+@celery_instance.task(name="warm_search_cache")
+def warm_search_cache():
+    return asyncio.run(warm_search_cache_helper())
@@ -0,0 +1,65 @@
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import Iterable
+
+
+Stay = tuple[int, date, date]  # (room_id, date_from, date_to)
+
+
+def peak_occupancy(stays: Iterable[Stay], date_from: date, date_to: date) -> dict[int, int]:
+    """
+    Peak number of units occupied per room over the nights date_from ... date_to - 1.
+
+    Pure-Python sweep over arrival/departure events, usable on cached bookings.
+    Mirrors src.repo.utils.rooms_peak_occupancy; rooms without any occupied night
+    in the window may be missing from the result.
+    """
+    events: dict[int, dict[date, int]] = defaultdict(lambda: defaultdict(int))
+    for room_id, stay_from, stay_to in stays:
+        start, end = max(stay_from, date_from), min(stay_to, date_to)
+        if start >= end:
+            continue
+        events[room_id][start] += 1
+        events[room_id][end] -= 1
+
+    peaks: dict[int, int] = {}
+    for room_id, deltas in events.items():
+        occupied = peak = 0
+        for day in sorted(deltas):
+            occupied += deltas[day]
+            peak = max(peak, occupied)
+        peaks[room_id] = peak
+    return peaks
+
+
+def rooms_left(
+        quantities: dict[int, int],
+        stays: Iterable[Stay],
+        date_from: date,
+        date_to: date,
+) -> dict[int, int]:
+    """Units still free for the whole window, per room in `quantities` (room_id -> quantity)."""
+    peaks = peak_occupancy(stays, date_from, date_to)
+    return {room_id: quantity - peaks.get(room_id, 0) for room_id, quantity in quantities.items()}
+
+
+def accept_stays(
+        quantities: dict[int, int],
+        booked: dict[tuple[int, date], int],
+        stays: Iterable[Stay],
+) -> list[bool]:
+    """
+    Greedily accepts `stays` in order: a stay fits when each of its nights still has a free
+    unit, counting the already `booked` units ((room_id, night) -> units) and the stays
+    accepted before it. Stays of rooms missing from `quantities` are rejected.
+    """
+    booked = defaultdict(int, booked)
+    accepted = []
+    for room_id, stay_from, stay_to in stays:
+        nights = [(room_id, stay_from + timedelta(days=offset)) for offset in range((stay_to - stay_from).days)]
+        fits = room_id in quantities and all(booked[night] < quantities[room_id] for night in nights)
+        if fits:
+            for night in nights:
+                booked[night] += 1
+        accepted.append(fits)
+    return accepted
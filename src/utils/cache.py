@@ -0,0 +1,284 @@
+import asyncio
+import hashlib
+import json
+import logging
+import math
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional, Tuple
+
+from fastapi_cache.types import Backend
+from redis.exceptions import RedisError
+from starlette.requests import Request
+from starlette.responses import Response
+
+from src.connectors.redis_connector import RedisConnector
+from src.utils.single_flight import should_refresh_early
+
+logger = logging.getLogger(__name__)
+
+
+def request_key_builder(
+        func: Callable[..., Any],
+        namespace: str = "",
+        *,
+        request: Optional[Request] = None,
+        response: Optional[Response] = None,
+        args: Tuple[Any, ...],
+        kwargs: dict[str, Any],
+) -> str:
+    """
+    Cache key from the request path and its sorted query params.
+
+    The default fastapi_cache key builder hashes the endpoint kwargs, which include the
+    per-request DBManager, so no two requests ever shared a key.
+    """
+    if request is None:
+        raw = f"{func.__module__}:{func.__name__}:{args}:{kwargs}"
+    else:
+        raw = f"{request.url.path}?{sorted(request.query_params.multi_items())}"
+    return f"{namespace}:{hashlib.md5(raw.encode()).hexdigest()}"
+
+
+@dataclass
+class _Fill:
+    """
+    A cache miss some request in this worker is computing; `set` resolves it. If the request
+    finishes without a `set` (the endpoint raised), its task's done callback drops the fill.
+    """
+    future: asyncio.Future
+    owner: asyncio.Task | None = None
+    abandon: Callable[[asyncio.Task], None] | None = None
+    started: float = field(default_factory=time.perf_counter)
+
+
+class TwoTierBackend(Backend):
+    """
+    fastapi_cache backend with a bounded per-worker LRU/TTL layer (L1) in front of Redis (L2).
+
+    L1 hits need neither network nor DB. An L1 entry lives at most `l1_ttl` seconds and
+    never outlives its Redis copy. `clear` drops the entries from Redis and publishes the
+    namespace/key on `channel`; `listen` (run once per worker) clears L1 in every worker.
+    Without Redis the backend degrades to the L1 layer alone.
+
+    Misses are single-flight per worker: the first request for a missing key computes it,
+    concurrent requests for the same key wait up to `miss_timeout` seconds for its `set`, or
+    until that request fails. At most `maxsize` misses are tracked at once.
+    Entries are refreshed early (XFetch) by one request while the rest keep being served the
+    cached copy, so hot keys do not all expire at once.
+    """
+
+    def __init__(
+            self,
+            redis_connector: RedisConnector,
+            maxsize: int = 1024,
+            l1_ttl: int = 10,
+            channel: str = "fastapi-cache:invalidate",
+            miss_timeout: float = 5.0,
+            beta: float = 1.0,
+    ):
+        self.redis_connector = redis_connector
+        self.maxsize = maxsize
+        self.l1_ttl = l1_ttl
+        self.channel = channel
+        self.miss_timeout = miss_timeout
+        self.beta = beta
+        # key -> (L1 expiry, value, compute seconds, Redis expiry), on the monotonic clock
+        self._l1: OrderedDict[str, tuple[float, bytes, float, float]] = OrderedDict()
+        self._fills: dict[str, _Fill] = {}
+        self.hits_l1 = 0
+        self.hits_l2 = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.early_refreshes = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @property
+    def redis(self):
+        return self.redis_connector.redis
+
+    def _get_local(self, key: str) -> tuple[float, bytes, float] | None:
+        """(seconds until the Redis copy expires, value, compute seconds) from L1."""
+        entry = self._l1.get(key)
+        if entry is None:
+            return None
+        l1_expires_at, value, delta, expires_at = entry
+        now = time.monotonic()
+        if l1_expires_at <= now:
+            del self._l1[key]
+            return None
+        self._l1.move_to_end(key)
+        return expires_at - now, value, delta
+
+    def _set_local(self, key: str, value: bytes, delta: float, ttl: float | None) -> None:
+        now = time.monotonic()
+        expires_at = now + ttl if ttl else math.inf
+        self._l1[key] = (min(expires_at, now + self.l1_ttl), value, delta, expires_at)
+        self._l1.move_to_end(key)
+        while len(self._l1) > self.maxsize:
+            self._l1.popitem(last=False)
+            self.evictions += 1
+
+    async def _get_remote(self, key: str) -> tuple[float, bytes, float] | None:
+        if self.redis is None:
+            return None
+        try:
+            async with self.redis_connector.pipeline() as pipe:
+                pttl, raw = await pipe.pttl(key).get(key).execute()
+        except RedisError:
+            logger.warning("Cache read failed for %s", key, exc_info=True)
+            return None
+        if raw is None:
+            return None
+        delta_ms, value = raw.split(b":", 1)
+        self._set_local(key, value, int(delta_ms) / 1000, pttl / 1000 if pttl > 0 else None)
+        return self._get_local(key)
+
+    def _start_fill(self, key: str) -> _Fill:
+        # Fills are in start order: drop the ones nobody waits for anymore, then the oldest
+        now = time.perf_counter()
+        while self._fills and (
+                len(self._fills) >= self.maxsize
+                or now - next(iter(self._fills.values())).started >= self.miss_timeout
+        ):
+            self._end_fill(*next(iter(self._fills.items())))
+        if key in self._fills:
+            self._end_fill(key, self._fills[key])
+
+        fill = self._fills[key] = _Fill(asyncio.get_running_loop().create_future(), asyncio.current_task())
+        if fill.owner is not None:
+            # The request is over once its task is: whatever it did not `set` it never will
+            fill.abandon = lambda task: self._end_fill(key, fill)
+            fill.owner.add_done_callback(fill.abandon)
+        return fill
+
+    def _end_fill(self, key: str, fill: _Fill, result: Tuple[int, Optional[bytes]] = (0, None)) -> None:
+        """Drops `fill` and resolves it (with a miss by default), so its waiters stop waiting."""
+        if self._fills.get(key) is fill:
+            del self._fills[key]
+        if fill.abandon is not None:
+            fill.owner.remove_done_callback(fill.abandon)
+        if not fill.future.done():
+            fill.future.set_result(result)
+
+    async def _wait(self, fill: _Fill) -> Tuple[int, Optional[bytes]]:
+        self.coalesced += 1
+        try:
+            result = await asyncio.wait_for(
+                asyncio.shield(fill.future),
+                timeout=fill.started + self.miss_timeout - time.perf_counter(),
+            )
+        except asyncio.TimeoutError:
+            result = 0, None
+        if result[1] is None:
+            self.misses += 1
+        return result
+
+    @staticmethod
+    def _ttl(remaining: float) -> int:
+        return -1 if remaining == math.inf else max(int(remaining), 1)
+
+    def clear_local(self, namespace: Optional[str] = None, key: Optional[str] = None) -> int:
+        if namespace:
+            keys = [k for k in self._l1 if k.startswith(f"{namespace}:")]
+        elif key:
+            keys = [key] if key in self._l1 else []
+        else:
+            keys = list(self._l1)
+        for k in keys:
+            del self._l1[k]
+        return len(keys)
+
+    async def get_with_ttl(self, key: str) -> Tuple[int, Optional[bytes]]:
+        local = self._get_local(key)
+        if local is not None:
+            self.hits_l1 += 1
+        else:
+            fill = self._fills.get(key)
+            if fill is not None and time.perf_counter() - fill.started < self.miss_timeout:
+                return await self._wait(fill)
+
+            # Registered before the Redis round trip, so concurrent misses share that too
+            fill = self._start_fill(key)
+            local = await self._get_remote(key)
+            if local is None:
+                self.misses += 1
+                return 0, None
+            self.hits_l2 += 1
+            self._end_fill(key, fill, (self._ttl(local[0]), local[1]))
+
+        remaining, value, delta = local
+        if key not in self._fills and should_refresh_early(delta, remaining, self.beta):
+            # Only this request recomputes; the others keep getting the cached copy meanwhile
+            self.early_refreshes += 1
+            self._start_fill(key)
+            return 0, None
+        return self._ttl(remaining), value
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return (await self.get_with_ttl(key))[1]
+
+    async def set(self, key: str, value: bytes, expire: Optional[int] = None) -> None:
+        fill = self._fills.get(key)
+        delta = time.perf_counter() - fill.started if fill else 0.0
+        self._set_local(key, value, delta, expire)
+        if fill:
+            self._end_fill(key, fill, (expire or -1, value))
+        if self.redis is not None:
+            # Compute time travels with the value, so every worker can apply early refresh
+            await self.redis.set(key, b"%d:" % round(delta * 1000) + value, ex=expire)
+
+    async def clear(self, namespace: Optional[str] = None, key: Optional[str] = None) -> int:
+        self.invalidations += 1
+        cleared = self.clear_local(namespace, key)
+        if self.redis is None:
+            return cleared
+
+        try:
+            if namespace:
+                keys = [k async for k in self.redis.scan_iter(match=f"{namespace}:*")]
+                cleared = await self.redis_connector.delete_many(keys)
+            elif key:
+                cleared = await self.redis.delete(key)
+            await self.redis.publish(self.channel, json.dumps({"namespace": namespace, "key": key}))
+        except RedisError:
+            # Other workers still drop their copies within l1_ttl
+            logger.warning("Cache invalidation failed for %s", namespace or key, exc_info=True)
+        return cleared
+
+    async def listen(self) -> None:
+        """Clears L1 on invalidations published by any worker. Runs until cancelled."""
+        if self.redis is None:
+            return
+        while True:
+            pubsub = self.redis.pubsub()
+            try:
+                await pubsub.subscribe(self.channel)
+                # Messages published while unsubscribed are lost, so start from an empty L1
+                self.clear_local()
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        self.clear_local(**json.loads(message["data"]))
+            except RedisError:
+                logger.warning("Cache invalidation listener lost Redis, retrying", exc_info=True)
+                self.clear_local()
+                await asyncio.sleep(1)
+            finally:
+                await pubsub.aclose()
+
+    def stats(self) -> dict:
+        lookups = self.hits_l1 + self.hits_l2 + self.misses + self.coalesced
+        return {
+            "size": len(self._l1),
+            "maxsize": self.maxsize,
+            "hits_l1": self.hits_l1,
+            "hits_l2": self.hits_l2,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "early_refreshes": self.early_refreshes,
+            "hit_ratio": round((lookups - self.misses) / lookups, 4) if lookups else None,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
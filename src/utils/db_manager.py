@@ -1,33 +1,89 @@
+from functools import cached_property
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.repo.base import PINNED_TO_PRIMARY
 from src.repo.amenities_repo import AmenitiesRepository, RoomAmenitiesRepository
 from src.repo.facilities_repo import FacilitiesRepository, RoomFacilitiesRepository
 from src.repo.bookings_repo import BookingsRepository
 from src.repo.hotels_repo import HotelsRepository
+from src.repo.occupancy_repo import RoomOccupancyRepository
 from src.repo.rooms_repo import RoomsRepository
 from src.repo.users_repo import UsersRepository
 
 
 
 class DBManager:
-    def __init__(self, session_factory):
-        self.session_factory = session_factory
+    """
+    Unit of work of a request. The session and repositories are created on first access and
+    the session checks out a connection only when it runs its first statement, so requests
+    served from cache or rejected before touching the DB cost no DB work at all.
 
-    async def __aenter__(self):
-        self.session = self.session_factory()
+    With `read_session_factory` (a replica) the repositories run their read-only queries
+    there until the unit of work opens a transaction on the primary; after a commit it
+    stays on the primary, so it reads its own writes; see BaseRepository.reader.
+    """
 
-        self.hotels = HotelsRepository(self.session)
-        self.rooms = RoomsRepository(self.session)
-        self.users = UsersRepository(self.session)
-        self.bookings = BookingsRepository(self.session)
-        self.amenities = AmenitiesRepository(self.session)
-        self.facilities = FacilitiesRepository(self.session)
-        self.room_facilities = RoomFacilitiesRepository(self.session)
-        self.room_amenities = RoomAmenitiesRepository(self.session)
+    def __init__(self, session_factory, read_session_factory=None):
+        self.session_factory = session_factory
+        self.read_session_factory = read_session_factory
 
+    async def __aenter__(self):
         return self
 
     async def __aexit__(self, *args):
-        await self.session.rollback()
-        await self.session.close()
+        for name in ("session", "read_session"):
+            session = self.__dict__.get(name)
+            if session is None:
+                continue
+            if session.in_transaction():
+                await session.rollback()
+            await session.close()
+
+    @cached_property
+    def session(self) -> AsyncSession:
+        return self.session_factory()
+
+    @cached_property
+    def read_session(self) -> AsyncSession | None:
+        return self.read_session_factory() if self.read_session_factory else None
+
+    @cached_property
+    def hotels(self) -> HotelsRepository:
+        return HotelsRepository(self.session, self.read_session)
+
+    @cached_property
+    def rooms(self) -> RoomsRepository:
+        return RoomsRepository(self.session, self.read_session)
+
+    @cached_property
+    def users(self) -> UsersRepository:
+        return UsersRepository(self.session, self.read_session)
+
+    @cached_property
+    def bookings(self) -> BookingsRepository:
+        return BookingsRepository(self.session, self.read_session)
+
+    @cached_property
+    def amenities(self) -> AmenitiesRepository:
+        return AmenitiesRepository(self.session, self.read_session)
+
+    @cached_property
+    def facilities(self) -> FacilitiesRepository:
+        return FacilitiesRepository(self.session, self.read_session)
+
+    @cached_property
+    def room_facilities(self) -> RoomFacilitiesRepository:
+        return RoomFacilitiesRepository(self.session, self.read_session)
+
+    @cached_property
+    def room_amenities(self) -> RoomAmenitiesRepository:
+        return RoomAmenitiesRepository(self.session, self.read_session)
+
+    @cached_property
+    def occupancy(self) -> RoomOccupancyRepository:
+        return RoomOccupancyRepository(self.session, self.read_session)
 
     async def commit(self):
         await self.session.commit()
+        self.session.info[PINNED_TO_PRIMARY] = True
@@ -0,0 +1,44 @@
+import csv
+import io
+from typing import AsyncIterator, Iterable, Literal
+
+from pydantic_core import to_json
+from sqlalchemy.engine import Row
+
+ExportFormat = Literal["ndjson", "csv"]
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+async def ndjson_chunks(batches: AsyncIterator[list[Row]]) -> AsyncIterator[bytes]:
+    """One JSON object per line; one chunk per batch of rows."""
+    async for rows in batches:
+        yield b"".join(to_json(row._asdict()) + b"\n" for row in rows)
+
+
+async def csv_chunks(columns: Iterable[str], batches: AsyncIterator[list[Row]]) -> AsyncIterator[bytes]:
+    """CSV with a header line; one chunk per batch of rows."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    async for rows in batches:
+        writer.writerows(rows)
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        # Header of an empty export
+        yield buffer.getvalue().encode()
+
+
+def export_chunks(
+        export_format: ExportFormat,
+        columns: Iterable[str],
+        batches: AsyncIterator[list[Row]],
+) -> AsyncIterator[bytes]:
+    if export_format == "csv":
+        return csv_chunks(columns, batches)
+    return ndjson_chunks(batches)
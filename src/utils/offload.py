@@ -0,0 +1,74 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, TypeVar
+
+from src.utils.pool_metrics import Histogram
+
+T = TypeVar("T")
+
+
+class QueueFull(Exception):
+    """More calls are waiting for a BoundedExecutor than its `max_queue`."""
+
+
+class BoundedExecutor:
+    """
+    Runs blocking calls (e.g. bcrypt) in a dedicated thread pool so they never block the
+    event loop, at most `max_workers` at a time.
+
+    Calls beyond that wait on a semaphore, not inside the executor, so the number waiting
+    is known: `queued` is the queue depth, and with `max_queue` set a call arriving at a
+    full queue raises QueueFull at once instead of piling up behind the others.
+    Only functions that release the GIL (bcrypt, hashlib, zlib...) actually run in parallel.
+    """
+
+    def __init__(self, max_workers: int, max_queue: int | None = None, name: str = "offload"):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+        self._semaphore = asyncio.Semaphore(max_workers)
+        self.queued = 0
+        self.running = 0
+        self.completed = 0
+        self.rejected = 0
+        self.wait_ms = Histogram((1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000))
+        self.run_ms = Histogram((10, 25, 50, 100, 250, 500, 1000, 5000))
+
+    async def run(self, func: Callable[..., T], *args) -> T:
+        if self.max_queue is not None and self._semaphore.locked() and self.queued >= self.max_queue:
+            self.rejected += 1
+            raise QueueFull(f"{self.queued} calls already waiting")
+
+        self.queued += 1
+        queued_at = time.perf_counter()
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self.queued -= 1
+        started = time.perf_counter()
+        self.wait_ms.observe((started - queued_at) * 1000)
+
+        self.running += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+        finally:
+            self.running -= 1
+            self.completed += 1
+            self.run_ms.observe((time.perf_counter() - started) * 1000)
+            self._semaphore.release()
+
+    def stats(self) -> dict:
+        return {
+            "max_workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "queued": self.queued,
+            "running": self.running,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "wait_ms": self.wait_ms.snapshot(),
+            "run_ms": self.run_ms.snapshot(),
+        }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
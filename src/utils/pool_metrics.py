@@ -0,0 +1,141 @@
+import bisect
+import time
+
+from sqlalchemy import event, exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool
+
+
+class Histogram:
+    """Cumulative histogram over fixed upper bounds, Prometheus style."""
+
+    def __init__(self, bounds: tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def snapshot(self) -> dict:
+        buckets, cumulative = {}, 0
+        for bound, count in zip((*self.bounds, "+Inf"), self.counts):
+            cumulative += count
+            buckets[str(bound)] = cumulative
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 3),
+            "avg": round(self.sum / self.count, 3) if self.count else None,
+            "buckets": buckets,
+        }
+
+
+class PoolMetrics:
+    """Counters and histograms of an engine's connection pool, per worker."""
+
+    def __init__(self):
+        self.checkout_ms = Histogram((0.1, 0.5, 1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000))
+        self.checked_out_ms = Histogram((1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000))
+        self.lifetime_s = Histogram((1, 10, 60, 300, 900, 1800, 3600))
+        self.connects = 0
+        self.closes = 0
+        self.invalidations = 0
+        self.exhausted = 0
+        self.timeouts = 0
+
+    def snapshot(self, pool: Pool) -> dict:
+        snapshot = {
+            "status": pool.status(),
+            "connects": self.connects,
+            "closes": self.closes,
+            "invalidations": self.invalidations,
+            "exhausted": self.exhausted,
+            "timeouts": self.timeouts,
+            "checkout_ms": self.checkout_ms.snapshot(),
+            "checked_out_ms": self.checked_out_ms.snapshot(),
+            "connection_lifetime_s": self.lifetime_s.snapshot(),
+        }
+        if isinstance(pool, AsyncAdaptedQueuePool):
+            snapshot |= {
+                "size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "checked_in": pool.checkedin(),
+                "overflow": pool.overflow(),
+            }
+        return snapshot
+
+
+# One per engine, labelled on /metrics
+pool_metrics = PoolMetrics()
+replica_pool_metrics = PoolMetrics()
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """
+    AsyncAdaptedQueuePool timing how long checkouts wait for a connection.
+
+    A checkout counts as exhausted when the pool and its overflow are all in use, so the
+    request had to queue for a connection; `timeouts` are the ones that gave up after
+    `pool_timeout`. The metrics live on the class so they survive `engine.dispose()`;
+    `with_metrics` makes a subclass reporting to another engine's PoolMetrics.
+    """
+
+    metrics = pool_metrics
+
+    def __init__(self, creator, pool_size: int = 5, max_overflow: int = 10, **kwargs):
+        super().__init__(creator, pool_size=pool_size, max_overflow=max_overflow, **kwargs)
+        self.overflow_limit = max_overflow
+
+    @classmethod
+    def with_metrics(cls, metrics: PoolMetrics) -> type["InstrumentedPool"]:
+        return type(cls.__name__, (cls,), {"metrics": metrics})
+
+    def _do_get(self):
+        # overflow() counts up to overflow_limit once every pooled connection is open
+        if self.checkedin() == 0 and -1 < self.overflow_limit <= self.overflow():
+            self.metrics.exhausted += 1
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.timeouts += 1
+            raise
+        finally:
+            self.metrics.checkout_ms.observe((time.perf_counter() - started) * 1000)
+
+
+def instrument_pool(engine: AsyncEngine, metrics: PoolMetrics = pool_metrics) -> None:
+    """Feeds `metrics` from the pool events of `engine` (including pools recreated by dispose)."""
+
+    def on_connect(dbapi_connection, connection_record):
+        metrics.connects += 1
+        connection_record.info["connected_at"] = time.monotonic()
+
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        connection_record.info["checked_out_at"] = time.perf_counter()
+
+    def on_checkin(dbapi_connection, connection_record):
+        checked_out_at = connection_record.info.pop("checked_out_at", None)
+        if checked_out_at is not None:
+            metrics.checked_out_ms.observe((time.perf_counter() - checked_out_at) * 1000)
+
+    def on_invalidate(dbapi_connection, connection_record, exception):
+        metrics.invalidations += 1
+
+    def on_close(dbapi_connection, connection_record):
+        metrics.closes += 1
+        connected_at = connection_record.info.pop("connected_at", None)
+        if connected_at is not None:
+            metrics.lifetime_s.observe(time.monotonic() - connected_at)
+
+    for name, listener in (
+            ("connect", on_connect),
+            ("checkout", on_checkout),
+            ("checkin", on_checkin),
+            ("invalidate", on_invalidate),
+            ("close", on_close),
+    ):
+        event.listen(engine.sync_engine, name, listener)
@@ -0,0 +1,70 @@
+import logging
+import uuid
+
+from redis.exceptions import RedisError
+
+from src.connectors.redis_connector import RedisConnector
+
+logger = logging.getLogger(__name__)
+
+# Sliding window log in a sorted set scored by milliseconds on the Redis clock, so all workers
+# share one clock. Returns 0 when the hit is allowed (and recorded), otherwise the milliseconds
+# until the oldest hit in the window leaves it.
+SLIDING_WINDOW_SCRIPT = """
+local time = redis.call('TIME')
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+local window = tonumber(ARGV[1])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now - window)
+if redis.call('ZCARD', KEYS[1]) >= tonumber(ARGV[2]) then
+    local oldest = redis.call('ZRANGE', KEYS[1], 0, 0, 'WITHSCORES')
+    return math.max(tonumber(oldest[2]) + window - now, 1)
+end
+redis.call('ZADD', KEYS[1], now, ARGV[3])
+redis.call('PEXPIRE', KEYS[1], window)
+return 0
+"""
+
+
+class SlidingWindowLimiter:
+    """
+    At most `limit` hits per key in any `window` seconds, counted in Redis across workers.
+    Fails open: without Redis (or on Redis errors) every hit is allowed.
+    """
+
+    def __init__(self, redis_connector: RedisConnector, name: str, limit: int, window: float):
+        self.redis_connector = redis_connector
+        self.name = name
+        self.limit = limit
+        self.window = window
+        self.allowed = 0
+        self.limited = 0
+        self.errors = 0
+
+    async def hit(self, key: str) -> float:
+        """Records a hit for `key`; returns 0 if allowed, else the seconds to wait before retrying."""
+        redis = self.redis_connector.redis
+        if redis is None:
+            return 0
+        try:
+            retry_after_ms = await redis.eval(
+                SLIDING_WINDOW_SCRIPT, 1, f"ratelimit:{self.name}:{key}",
+                int(self.window * 1000), self.limit, uuid.uuid4().hex,
+            )
+        except RedisError:
+            self.errors += 1
+            logger.warning("Rate limiter %s failed open", self.name, exc_info=True)
+            return 0
+        if retry_after_ms:
+            self.limited += 1
+            return retry_after_ms / 1000
+        self.allowed += 1
+        return 0
+
+    def stats(self) -> dict:
+        return {
+            "limit": self.limit,
+            "window": self.window,
+            "allowed": self.allowed,
+            "limited": self.limited,
+            "errors": self.errors,
+        }
@@ -0,0 +1,22 @@
+from typing import Any
+
+from pydantic_core import to_json
+from starlette.responses import Response
+
+
+class FastJSONResponse(Response):
+    """
+    JSON response serialized by pydantic-core straight to bytes.
+
+    Returning it from an endpoint skips FastAPI's response_model re-validation and the
+    jsonable_encoder pass; the route's response_model then only documents the schema.
+    Accepts Pydantic models as well as plain containers of them.
+    """
+    media_type = "application/json"
+
+    def __init__(self, content: Any, exclude_none: bool = False, **kwargs):
+        self.exclude_none = exclude_none
+        super().__init__(content, **kwargs)
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content, exclude_none=self.exclude_none)
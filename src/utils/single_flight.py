@@ -0,0 +1,40 @@
+import asyncio
+import math
+import random
+from typing import Awaitable, Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+def should_refresh_early(delta: float, ttl: float, beta: float = 1.0) -> bool:
+    """
+    XFetch (probabilistic early expiration): recompute before `ttl` runs out with a probability
+    that grows as expiry nears and with the time `delta` the value took to compute.
+    """
+    if delta <= 0:
+        return False
+    return delta * beta * -math.log(1 - random.random()) >= ttl
+
+
+class SingleFlight:
+    """Coalesces concurrent calls for the same key in this worker into one in-flight call."""
+
+    def __init__(self):
+        self._calls: dict[Hashable, asyncio.Task] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    def in_flight(self, key: Hashable) -> bool:
+        return key in self._calls
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        task = self._calls.get(key)
+        if task is None:
+            self.calls += 1
+            # A task of its own, so a cancelled caller does not cancel the call for everyone else
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._calls.pop(key, None) if self._calls.get(key) is done else None)
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
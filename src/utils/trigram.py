@@ -0,0 +1,78 @@
+import re
+from typing import Iterable, TypeVar
+
+
+# Same default as pg_trgm.word_similarity_threshold, used by the `%>` operator.
+WORD_SIMILARITY_THRESHOLD = 0.6
+
+_WORD = re.compile(r"[^\W_]+")
+
+T = TypeVar("T")
+
+
+def trigrams_in_order(text: str) -> list[str]:
+    """Trigrams the way pg_trgm builds them: lowercased words padded as '  word ', in order."""
+    result = []
+    for word in _WORD.findall(text.lower()):
+        padded = f"  {word} "
+        result += [padded[i:i + 3] for i in range(len(padded) - 2)]
+    return result
+
+
+def trigrams(text: str) -> set[str]:
+    """Pure-Python `show_trgm`."""
+    return set(trigrams_in_order(text))
+
+
+def similarity(a: str, b: str) -> float:
+    """Pure-Python `similarity(a, b)`: shared trigrams over all distinct trigrams."""
+    a_trgm, b_trgm = trigrams(a), trigrams(b)
+    if not a_trgm or not b_trgm:
+        return 0.0
+    return len(a_trgm & b_trgm) / len(a_trgm | b_trgm)
+
+
+def word_similarity(a: str, b: str) -> float:
+    """
+    Pure-Python `word_similarity(a, b)`: best similarity between the trigrams of `a`
+    and any continuous extent of the ordered trigrams of `b`.
+
+    pg_trgm searches the extents greedily, so rare edge cases may differ slightly from Postgres.
+    """
+    a_trgm = trigrams(a)
+    b_ordered = trigrams_in_order(b)
+    if not a_trgm or not b_ordered:
+        return 0.0
+
+    best = 0.0
+    for start in range(len(b_ordered)):
+        if b_ordered[start] not in a_trgm:
+            continue
+        extent = set()
+        for end in range(start, len(b_ordered)):
+            extent.add(b_ordered[end])
+            if b_ordered[end] in a_trgm:
+                best = max(best, len(a_trgm & extent) / len(a_trgm | extent))
+    return best
+
+
+def rank_hotels(
+        hotels: Iterable[T],
+        name: str | None = None,
+        location: str | None = None,
+        threshold: float = WORD_SIMILARITY_THRESHOLD,
+) -> list[T]:
+    """
+    In-memory twin of the fuzzy hotel search: keeps hotels whose name/location pass
+    `column %> query`, ordered by summed word similarity, then id.
+    """
+    ranked = []
+    for hotel in hotels:
+        scores = []
+        if name:
+            scores.append(word_similarity(name, hotel.name))
+        if location:
+            scores.append(word_similarity(location, hotel.location))
+        if all(score >= threshold for score in scores):
+            ranked.append((-sum(scores), hotel.id, hotel))
+    return [hotel for _, _, hotel in sorted(ranked, key=lambda item: item[:2])]
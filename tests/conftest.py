@@ -3,6 +3,7 @@ import json
 import pytest
 
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
 from src.main import app
 
 from src.config import settings
@@ -17,6 +18,8 @@ async def async_main():
     assert settings.MODE == "TEST"
 
     async with engine_null_pool.begin() as conn:
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS btree_gist"))
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
         await conn.run_sync(BaseModel.metadata.drop_all)
         await conn.run_sync(BaseModel.metadata.create_all)
 
@@ -0,0 +1,44 @@
+from datetime import date, timedelta
+
+from hypothesis import HealthCheck, given, settings, strategies as st
+from sqlalchemy import select
+
+from src.repo.utils import rooms_booked_in_range, rooms_peak_occupancy
+from src.schemas.bookings_schemas import BookingTest
+from src.utils.availability import peak_occupancy
+
+
+# Far enough in the future not to collide with bookings created by other tests.
+START = date(2031, 1, 1)
+
+days = st.integers(min_value=0, max_value=20).map(lambda d: START + timedelta(days=d))
+
+
+async def fetch_peaks(db, cte) -> dict[int, int]:
+    result = await db.session.execute(select(cte.c.room_id, cte.c.rooms_booked))
+    return {room_id: booked for room_id, booked in result.all() if booked}
+
+
+@settings(max_examples=25, deadline=None, suppress_health_check=[HealthCheck.function_scoped_fixture])
+@given(
+    raw_stays=st.lists(st.tuples(st.integers(min_value=0, max_value=2), days, days), max_size=15),
+    date_from=days,
+    date_to=days,
+)
+async def test_sql_and_python_engines_agree(db, raw_stays, date_from, date_to):
+    user_id = (await db.users.get_all())[0].id
+    room_ids = [room.id for room in (await db.rooms.get_all())[:3]]
+    stays = [(room_ids[i], min(a, b), max(a, b)) for i, a, b in raw_stays]
+
+    try:
+        await db.bookings.add_bulk([
+            BookingTest(room_id=room_id, user_id=user_id, date_from=stay_from, date_to=stay_to, price_per_night=100)
+            for room_id, stay_from, stay_to in stays
+        ])
+
+        expected = {room_id: peak for room_id, peak in peak_occupancy(stays, date_from, date_to).items() if peak}
+
+        assert await fetch_peaks(db, rooms_peak_occupancy(date_from, date_to)) == expected
+        assert await fetch_peaks(db, rooms_booked_in_range(date_from, date_to)) == expected
+    finally:
+        await db.session.rollback()
@@ -1,6 +1,13 @@
+import asyncio
 from datetime import date
 
-from src.schemas.bookings_schemas import BookingTest
+from sqlalchemy import select
+
+from src.database import async_session_maker_null_pool
+from src.repo.utils import rooms_peak_occupancy
+from src.schemas.bookings_schemas import Booking, BookingTest
+from src.schemas.rooms_schemas import RoomCreateInternal
+from src.utils.db_manager import DBManager
 
 
 async def test_booking_crud(db):
@@ -67,4 +74,74 @@ async def test_booking_crud(db):
     assert deleted_id is not None
 
     deleted_booking = await db.bookings.get_one_or_none(id=new_booking_id)
-    assert deleted_booking is None
\ No newline at end of file
+    assert deleted_booking is None
+
+async def test_booking_keeps_occupancy_ledger(db):
+    user_id = (await db.users.get_all())[0].id
+    room_id = (await db.rooms.get_all())[0].id
+
+    booking_data = BookingTest(
+        user_id=user_id,
+        room_id=room_id,
+        date_from=date(year=2027, month=1, day=10),
+        date_to=date(year=2027, month=1, day=13),
+        price_per_night=200,
+    )
+    booking_id = await db.bookings.add(booking_data)
+    await db.commit()
+
+    nights = await db.occupancy.get_filtered(room_id=room_id)
+    booked = {n.night: n.booked for n in nights if n.booked and n.night.year == 2027}
+    assert booked == {
+        date(2027, 1, 10): 1,
+        date(2027, 1, 11): 1,
+        date(2027, 1, 12): 1,
+    }
+
+    await db.bookings.delete(booking_id)
+    await db.commit()
+
+    nights = await db.occupancy.get_filtered(room_id=room_id)
+    assert all(n.booked == 0 for n in nights if n.night.year == 2027)
+
+
+async def test_bulk_booking_reports_conflicts(db):
+    user_id = (await db.users.get_all())[0].id
+    room = (await db.rooms.get_all())[0]
+
+    stay = dict(room_id=room.id, date_from=date(2033, 3, 1), date_to=date(2033, 3, 4))
+    bookings = [Booking(**stay) for _ in range(room.quantity + 1)]
+    bookings.append(Booking(room_id=10 ** 6, date_from=date(2033, 3, 1), date_to=date(2033, 3, 2)))
+
+    results = await db.bookings.book(user_id, bookings)
+    await db.commit()
+
+    assert [result.status for result in results] == ["created"] * room.quantity + ["conflict", "room_not_found"]
+    created = await db.bookings.get_filtered(room_id=room.id, date_from=date(2033, 3, 1))
+    assert {booking.id for booking in created} == {result.booking_id for result in results[:room.quantity]}
+    assert all(booking.price_per_night == room.price_per_night for booking in created)
+
+    # The ledger now shows the room as full, for later batches too
+    [result] = await db.bookings.book(user_id, [Booking(**stay)])
+    assert result.status == "conflict"
+
+
+async def test_concurrent_bookings_never_overbook(db):
+    user_id = (await db.users.get_all())[0].id
+    hotel_id = (await db.hotels.get_all())[0].id
+    room_id = await db.rooms.add(RoomCreateInternal(hotel_id=hotel_id, name="Last Unit", price_per_night=90, quantity=2))
+    await db.commit()
+
+    async def book():
+        async with DBManager(session_factory=async_session_maker_null_pool) as db_:
+            [result] = await db_.bookings.book(
+                user_id, [Booking(room_id=room_id, date_from=date(2034, 7, 1), date_to=date(2034, 7, 3))]
+            )
+            await db_.commit()
+            return result.status
+
+    statuses = await asyncio.gather(*[book() for _ in range(20)])
+
+    assert statuses.count("created") == 2
+    peaks = dict((await db.session.execute(select(rooms_peak_occupancy(date(2034, 7, 1), date(2034, 7, 3))))).all())
+    assert peaks[room_id] == 2
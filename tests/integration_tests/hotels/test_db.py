@@ -1,5 +1,9 @@
+from datetime import date
+
 from src.database import async_session_maker_null_pool
 from src.schemas.hotels_schemas import Hotel
+from src.schemas.pagination import PaginationParams
+from src.utils.trigram import rank_hotels
 from src.utils.db_manager import DBManager
 
 
@@ -7,3 +11,55 @@ async def test_add_hotel(db):
     hotel_data = Hotel(name="Test Hotel Name", location="Test Location Name")
     await db.hotels.add(hotel_data)
     await db.commit()
+
+
+async def test_hotels_keyset_pagination(db):
+    first_page = await db.hotels.get_all_hotels(PaginationParams(page=1, per_page=3))
+    assert first_page.next_cursor is not None
+
+    offset_ids = []
+    page = 1
+    while True:
+        result = await db.hotels.get_all_hotels(PaginationParams(page=page, per_page=3))
+        if not result.hotels:
+            break
+        offset_ids += [hotel.id for hotel in result.hotels]
+        page += 1
+
+    keyset_ids = [hotel.id for hotel in first_page.hotels]
+    cursor = first_page.next_cursor
+    while cursor:
+        result = await db.hotels.get_all_hotels(PaginationParams(page=1, per_page=3, after=cursor))
+        keyset_ids += [hotel.id for hotel in result.hotels]
+        cursor = result.next_cursor
+
+    assert keyset_ids == offset_ids
+
+
+async def test_fuzzy_search_matches_python_ranking(db):
+    result = await db.hotels.search_hotels(PaginationParams(page=1, per_page=25), name="plazza", fuzzy=True)
+    assert result.hotels[0].name == "The Plaza"
+
+    all_hotels = await db.hotels.get_all()
+    expected = rank_hotels(all_hotels, name="plazza")
+    assert [hotel.id for hotel in result.hotels] == [hotel.id for hotel in expected]
+
+
+async def test_search_with_dates_returns_available_rooms(db):
+    date_from, date_to = date(2033, 3, 1), date(2033, 3, 5)
+    result = await db.hotels.search_hotels(PaginationParams(page=1, per_page=25), date_from=date_from, date_to=date_to)
+
+    assert result.total_found == len(result.hotels)
+    for hotel in result.hotels:
+        expected_rooms = await db.rooms.search_rooms(hotel_id=hotel.id, date_from=date_from, date_to=date_to)
+        assert sorted(room.id for room in hotel.rooms) == sorted(room.id for room in expected_rooms)
+        assert all(room.rooms_left > 0 for room in hotel.rooms)
+
+
+async def test_list_queries_skip_orm_hydration(db):
+    hotels = await db.hotels.get_all()
+    rooms = await db.rooms.get_filtered(hotel_id=hotels[0].id)
+    page = await db.hotels.search_hotels(PaginationParams(page=1, per_page=5), location="a")
+
+    assert hotels and rooms and page.hotels
+    assert len(db.session.identity_map) == 0
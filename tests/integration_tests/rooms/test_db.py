@@ -0,0 +1,29 @@
+from src.schemas.facilities_schemas import Facility
+from src.schemas.rooms_schemas import RoomCreateInternal
+
+
+async def room_facility_ids(db, room_id: int) -> set[int]:
+    return {link.facility_id for link in await db.room_facilities.get_filtered(room_id=room_id)}
+
+
+async def test_set_rooms_facilities_applies_the_diff_per_room(db):
+    facility_ids = [await db.facilities.add(Facility(title=f"Facility {n}", description="")) for n in range(3)]
+    room_ids = await db.rooms.add_bulk([
+        RoomCreateInternal(hotel_id=1, name=f"M2M Room {n}", description="", price_per_night=100, quantity=1)
+        for n in range(3)
+    ])
+    await db.room_facilities.set_rooms_facilities({room_ids[0]: facility_ids[:2], room_ids[1]: facility_ids[:1]})
+    kept_id = (await db.room_facilities.get_filtered(room_id=room_ids[0], facility_id=facility_ids[0]))[0].id
+
+    await db.room_facilities.set_rooms_facilities({
+        room_ids[0]: [facility_ids[0], facility_ids[2], facility_ids[2]],
+        room_ids[1]: [],
+        room_ids[2]: facility_ids[1:],
+    })
+
+    assert await room_facility_ids(db, room_ids[0]) == {facility_ids[0], facility_ids[2]}
+    assert await room_facility_ids(db, room_ids[1]) == set()
+    assert await room_facility_ids(db, room_ids[2]) == set(facility_ids[1:])
+    # Links that stay are left in place, not deleted and re-inserted
+    assert (await db.room_facilities.get_filtered(room_id=room_ids[0], facility_id=facility_ids[0]))[0].id == kept_id
+    await db.session.rollback()
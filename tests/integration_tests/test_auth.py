@@ -13,3 +13,13 @@ def test_decode_encode_access_token():
 
     assert payload
     assert payload["user_id"] == data["user_id"]
+
+
+async def test_log_out_revokes_token(ac):
+    credentials = {"email": "test_signup@test-signup.com", "password": "test_pwd"}
+    access_token = (await ac.post("/auth/log_in", json=credentials)).json()["access_token"]
+    ac.cookies.clear()
+
+    assert (await ac.get("/auth/current_user", cookies={"access_token": access_token})).status_code == 200
+    await ac.post("/auth/log_out", cookies={"access_token": access_token})
+    assert (await ac.get("/auth/current_user", cookies={"access_token": access_token})).status_code == 401
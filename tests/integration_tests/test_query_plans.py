@@ -0,0 +1,130 @@
+import re
+from datetime import date
+
+import pytest
+from sqlalchemy import Select, select, text
+
+from src.repo.utils import rooms_peak_occupancy
+from src.schemas.pagination import PaginationParams
+
+# Production-like volumes: ~1% of the rows (or less) match each selective lookup below, so
+# with fresh statistics the planner only picks an index when one can actually serve the query.
+SEED_STATEMENTS = [
+    """
+    INSERT INTO users (email, hashed_password)
+    SELECT 'plan-' || n || '@example.com', 'x' FROM generate_series(1, 1000) AS n
+    """,
+    """
+    INSERT INTO hotels (name, location)
+    SELECT 'Plan hotel ' || n, 'Plan city ' || n % 100 FROM generate_series(1, 1000) AS n
+    """,
+    """
+    INSERT INTO rooms (hotel_id, name, description, price_per_night, quantity)
+    SELECT hotels.id, 'Plan room ' || n, NULL, 100 + n, 5
+    FROM hotels, generate_series(1, 10) AS n
+    WHERE hotels.name LIKE 'Plan hotel %'
+    """,
+    """
+    INSERT INTO bookings (id, room_id, user_id, date_from, date_to, price_per_night)
+    SELECT gen_random_uuid(), room_ids[1 + n % cardinality(room_ids)], user_ids[1 + n % cardinality(user_ids)],
+           DATE '2030-01-01' + n % 3650, DATE '2030-01-01' + n % 3650 + 3, 100
+    FROM generate_series(1, 100000) AS n,
+         (SELECT array_agg(id) AS room_ids FROM rooms WHERE name LIKE 'Plan room %') AS r,
+         (SELECT array_agg(id) AS user_ids FROM users WHERE email LIKE 'plan-%') AS u
+    """,
+    """
+    INSERT INTO room_occupancy (room_id, night, booked)
+    SELECT room_id, night::date, count(*)
+    FROM bookings, generate_series(date_from, date_to - 1, INTERVAL '1 day') AS night
+    WHERE date_from >= DATE '2030-01-01'
+    GROUP BY room_id, night
+    ON CONFLICT (room_id, night) DO UPDATE SET booked = room_occupancy.booked + excluded.booked
+    """,
+    """
+    INSERT INTO facilities (title, description)
+    SELECT 'Plan facility ' || n, '' FROM generate_series(1, 20) AS n
+    """,
+    """
+    INSERT INTO room_facilities (room_id, facility_id)
+    SELECT rooms.id, facilities.id FROM rooms, facilities
+    WHERE rooms.name LIKE 'Plan room %' AND facilities.title IN ('Plan facility 1', 'Plan facility 2')
+    """,
+    "ANALYZE users, hotels, rooms, bookings, room_occupancy, facilities, room_facilities",
+]
+
+
+@pytest.fixture
+async def recorded_queries(db, monkeypatch):
+    """Records every SELECT a repository sends through the session."""
+    queries = []
+    execute, scalar = db.session.execute, db.session.scalar
+
+    async def recording_execute(statement, *args, **kwargs):
+        if isinstance(statement, Select):
+            queries.append(statement)
+        return await execute(statement, *args, **kwargs)
+
+    async def recording_scalar(statement, *args, **kwargs):
+        if isinstance(statement, Select):
+            queries.append(statement)
+        return await scalar(statement, *args, **kwargs)
+
+    monkeypatch.setattr(db.session, "execute", recording_execute)
+    monkeypatch.setattr(db.session, "scalar", recording_scalar)
+    yield queries
+    await db.session.rollback()
+
+
+@pytest.fixture
+async def seeded(db, recorded_queries):
+    """
+    Seeds the tables inside the test transaction and analyzes them; ANALYZE counts the
+    transaction's own rows, and the rollback afterwards discards rows and statistics alike.
+    """
+    for statement in SEED_STATEMENTS:
+        await db.session.execute(text(statement))
+    user_id = await db.session.scalar(text("SELECT min(id) FROM users WHERE email LIKE 'plan-%'"))
+    hotel_id = await db.session.scalar(text("SELECT min(id) FROM hotels WHERE name LIKE 'Plan hotel %'"))
+    return user_id, hotel_id
+
+
+async def explain(db, statement) -> str:
+    sql = statement.compile(dialect=db.session.bind.dialect, compile_kwargs={"literal_binds": True})
+    result = await db.session.execute(text(f"EXPLAIN {sql}"))
+    return "\n".join(result.scalars().all())
+
+
+async def plans_of(db, recorded_queries, call) -> list[str]:
+    recorded_queries.clear()
+    await call
+    return [await explain(db, statement) for statement in list(recorded_queries)]
+
+
+def assert_no_seq_scan(plans: list[str], *tables: str):
+    assert plans
+    pattern = re.compile(rf"Seq Scan on ({'|'.join(tables)})\b")
+    for plan in plans:
+        assert not pattern.search(plan), plan
+
+
+async def test_repository_queries_use_indexes(db, recorded_queries, seeded):
+    user_id, hotel_id = seeded
+    pagination = PaginationParams(page=1, per_page=10)
+    date_from, date_to = date(2032, 1, 5), date(2032, 1, 9)
+
+    assert_no_seq_scan(await plans_of(db, recorded_queries, db.bookings.get_todays_checkins()), "bookings")
+    assert_no_seq_scan(
+        await plans_of(db, recorded_queries, db.bookings.get_bookings_current_user(user_id, pagination)),
+        "bookings",
+    )
+    assert_no_seq_scan(await plans_of(db, recorded_queries, db.rooms.get_filtered(hotel_id=hotel_id)), "rooms")
+    assert_no_seq_scan(
+        await plans_of(db, recorded_queries, db.rooms.search_rooms(hotel_id=hotel_id, date_from=date_from, date_to=date_to)),
+        "room_occupancy", "bookings",
+    )
+    # Searching all hotels reads every hotel and room anyway; only the occupancy lookup must stay narrow.
+    assert_no_seq_scan(
+        await plans_of(db, recorded_queries, db.hotels.search_hotels(pagination, date_from=date_from, date_to=date_to)),
+        "room_occupancy", "bookings",
+    )
+    assert_no_seq_scan([await explain(db, select(rooms_peak_occupancy(date_from, date_to)))], "bookings")
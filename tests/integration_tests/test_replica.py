@@ -0,0 +1,37 @@
+from src.database import async_session_maker_null_pool
+from src.models.hotels_models import HotelsModel
+from src.schemas.hotels_schemas import Hotel
+from src.schemas.pagination import PaginationParams
+from src.utils.db_manager import DBManager
+
+
+async def test_reads_use_replica_until_unit_of_work_writes():
+    # A second connection to the test database stands in for the replica
+    async with DBManager(
+            session_factory=async_session_maker_null_pool,
+            read_session_factory=async_session_maker_null_pool,
+    ) as db:
+        await db.hotels.get_all()
+        await db.hotels.get_all_hotels(PaginationParams(page=1, per_page=5))
+        await db.rooms.search_rooms(hotel_id=1)
+        assert db.read_session.in_transaction()
+        assert not db.session.in_transaction()
+
+        hotel_id = await db.hotels.add(Hotel(name="Replica Routing Hotel", location="Nowhere"))
+
+        # Read-your-writes: the uncommitted hotel is only visible through the primary
+        hotels = await db.hotels.get_filtered(HotelsModel.name == "Replica Routing Hotel")
+        assert [hotel.id for hotel in hotels] == [hotel_id]
+        assert db.hotels.reader is db.session
+
+        # Still on the primary once committed, where the replica could lag behind
+        await db.commit()
+        assert not db.session.in_transaction()
+        assert db.hotels.reader is db.session
+        await db.hotels.delete(hotel_id)
+        await db.commit()
+
+
+async def test_without_replica_reads_use_primary(db):
+    assert db.read_session is None
+    assert db.hotels.reader is db.session
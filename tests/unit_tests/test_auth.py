@@ -1,4 +1,11 @@
-from src.services.auth import AuthService
+import time
+
+import jwt
+import pytest
+from fastapi import HTTPException
+
+from src.config import settings
+from src.services.auth import AuthService, ClaimsCache
 
 
 def test_create_access_token():
@@ -7,3 +14,42 @@ def test_create_access_token():
 
     assert jwt_token
     assert isinstance(jwt_token, str)
+
+
+async def test_password_hashing_off_the_event_loop():
+    auth = AuthService()
+    hashed_password = await auth.hash_password_async("secret")
+
+    assert await auth.verify_and_update_async("secret", hashed_password) == (True, None)
+    assert await auth.verify_and_update_async("wrong", hashed_password) == (False, None)
+
+
+def test_decode_token_caches_verified_claims(monkeypatch):
+    auth = AuthService(claims_cache_size=2)
+    token = auth.create_access_token({"user_id": 1})
+
+    assert auth.decode_token(token)["user_id"] == 1
+    monkeypatch.setattr(jwt, "decode", lambda *args, **kwargs: pytest.fail("signature checked again"))
+    assert auth.decode_token(token)["user_id"] == 1
+    assert (auth.claims_cache.hits, auth.claims_cache.misses) == (1, 1)
+
+
+def test_claims_cache_honors_exp_and_size():
+    cache = ClaimsCache(maxsize=2)
+    cache.set(b"expired", {"user_id": 1, "exp": time.time() - 1})
+    cache.set(b"a", {"user_id": 2, "exp": time.time() + 60})
+    cache.set(b"b", {"user_id": 3, "exp": time.time() + 60})
+    cache.set(b"no-exp", {"user_id": 4})
+
+    assert cache.get(b"expired") is None
+    assert cache.get(b"a")["user_id"] == 2
+    assert cache.get(b"b")["user_id"] == 3
+    assert cache.get(b"no-exp") is None
+
+
+def test_decode_expired_token():
+    token = jwt.encode({"user_id": 1, "exp": int(time.time()) - 10}, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
+
+    with pytest.raises(HTTPException) as exc_info:
+        AuthService(claims_cache_size=10).decode_token(token)
+    assert exc_info.value.status_code == 401
@@ -0,0 +1,65 @@
+from datetime import date, timedelta
+
+from hypothesis import given, strategies as st
+
+from src.utils.availability import accept_stays, peak_occupancy, rooms_left
+
+
+START = date(2030, 1, 1)
+
+days = st.integers(min_value=0, max_value=30).map(lambda d: START + timedelta(days=d))
+stays = st.lists(st.tuples(st.integers(min_value=1, max_value=4), days, days), max_size=40)
+
+
+def brute_force_peaks(stays, date_from, date_to):
+    peaks = {}
+    night = date_from
+    while night < date_to:
+        for room_id in {room_id for room_id, _, _ in stays}:
+            occupied = sum(1 for r, f, t in stays if r == room_id and f <= night < t)
+            peaks[room_id] = max(peaks.get(room_id, 0), occupied)
+        night += timedelta(days=1)
+    return {room_id: peak for room_id, peak in peaks.items() if peak}
+
+
+@given(stays=stays, date_from=days, date_to=days)
+def test_peak_occupancy_matches_per_night_count(stays, date_from, date_to):
+    peaks = peak_occupancy(stays, date_from, date_to)
+
+    assert {room_id: peak for room_id, peak in peaks.items() if peak} == brute_force_peaks(stays, date_from, date_to)
+
+
+def test_back_to_back_stays_take_one_unit():
+    stays = [
+        (1, date(2030, 1, 1), date(2030, 1, 5)),
+        (1, date(2030, 1, 5), date(2030, 1, 9)),
+    ]
+
+    assert peak_occupancy(stays, date(2030, 1, 1), date(2030, 1, 9)) == {1: 1}
+    assert rooms_left({1: 1, 2: 3}, stays, date(2030, 1, 3), date(2030, 1, 7)) == {1: 0, 2: 3}
+
+
+@given(stays=stays)
+def test_accepted_stays_never_exceed_quantity(stays):
+    quantities = {1: 1, 2: 2, 3: 3}
+    stays = [(room_id, min(f, t), max(f, t) + timedelta(days=1)) for room_id, f, t in stays]
+
+    accepted = accept_stays(quantities, {}, stays)
+
+    kept = [stay for stay, fits in zip(stays, accepted) if fits]
+    peaks = brute_force_peaks(kept, START, START + timedelta(days=32))
+    assert all(peaks[room_id] <= quantities[room_id] for room_id in peaks)
+    assert not any(fits for (room_id, _, _), fits in zip(stays, accepted) if room_id not in quantities)
+
+
+def test_accept_stays_counts_already_booked_nights():
+    booked = {(1, date(2030, 1, 2)): 2}
+    stays = [
+        (1, date(2030, 1, 1), date(2030, 1, 2)),
+        (1, date(2030, 1, 1), date(2030, 1, 3)),
+        (1, date(2030, 1, 3), date(2030, 1, 4)),
+        (1, date(2030, 1, 1), date(2030, 1, 2)),
+        (1, date(2030, 1, 1), date(2030, 1, 2)),
+    ]
+
+    assert accept_stays({1: 2}, booked, stays) == [True, False, True, True, False]
@@ -0,0 +1,107 @@
+import asyncio
+import time
+
+import pytest
+
+from src.connectors.redis_connector import RedisConnector
+from src.utils.cache import TwoTierBackend
+
+
+def make_backend(**kwargs) -> TwoTierBackend:
+    return TwoTierBackend(RedisConnector(host="localhost", port=6379), **kwargs)
+
+
+async def test_l1_evicts_least_recently_used():
+    backend = make_backend(maxsize=2)
+    await backend.set("ns:a", b"a", expire=10)
+    await backend.set("ns:b", b"b", expire=10)
+    assert await backend.get("ns:a") == b"a"
+
+    await backend.set("ns:c", b"c", expire=10)
+
+    assert await backend.get("ns:b") is None
+    assert await backend.get("ns:a") == b"a"
+    assert await backend.get("ns:c") == b"c"
+    assert backend.stats()["evictions"] == 1
+
+
+async def test_l1_entries_expire(monkeypatch):
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+    backend = make_backend(l1_ttl=5)
+    await backend.set("ns:a", b"a", expire=60)
+
+    monkeypatch.setattr(time, "monotonic", lambda: now + 4)
+    assert await backend.get_with_ttl("ns:a") == (56, b"a")
+
+    monkeypatch.setattr(time, "monotonic", lambda: now + 6)
+    assert await backend.get("ns:a") is None
+
+
+async def test_concurrent_misses_wait_for_the_first():
+    backend = make_backend()
+
+    assert await backend.get_with_ttl("ns:a") == (0, None)
+    follower = asyncio.create_task(backend.get_with_ttl("ns:a"))
+    await asyncio.sleep(0)
+    assert not follower.done()
+
+    await backend.set("ns:a", b"a", expire=10)
+
+    assert await follower == (10, b"a")
+    assert backend.stats()["coalesced"] == 1
+
+
+async def test_failed_fill_releases_waiters():
+    backend = make_backend(miss_timeout=5)
+
+    async def failing_request():
+        assert await backend.get_with_ttl("ns:a") == (0, None)
+        await asyncio.sleep(0.01)
+        raise ValueError("bad cursor")
+
+    request = asyncio.create_task(failing_request())
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(backend.get_with_ttl("ns:a"))
+    with pytest.raises(ValueError):
+        await request
+
+    started = time.perf_counter()
+    assert await follower == (0, None)
+    assert await backend.get_with_ttl("ns:b") == (0, None)
+    assert time.perf_counter() - started < 1
+    assert list(backend._fills) == ["ns:b"]
+
+
+async def test_fills_are_bounded():
+    backend = make_backend(maxsize=2)
+
+    for key in ("ns:a", "ns:b", "ns:c"):
+        assert await backend.get_with_ttl(key) == (0, None)
+
+    assert list(backend._fills) == ["ns:b", "ns:c"]
+    # A dropped fill is recomputed by its next request rather than waited for
+    assert await asyncio.wait_for(backend.get_with_ttl("ns:a"), timeout=1) == (0, None)
+
+
+async def test_clear_namespace_and_stats():
+    backend = make_backend()
+    await backend.set("fastapi-cache:facilities:1", b"f", expire=10)
+    await backend.set("fastapi-cache:amenities:1", b"a", expire=10)
+
+    assert await backend.clear(namespace="fastapi-cache:facilities") == 1
+
+    assert await backend.get("fastapi-cache:facilities:1") is None
+    assert await backend.get("fastapi-cache:amenities:1") == b"a"
+    assert backend.stats() == {
+        "size": 1,
+        "maxsize": 1024,
+        "hits_l1": 1,
+        "hits_l2": 0,
+        "misses": 1,
+        "coalesced": 0,
+        "early_refreshes": 0,
+        "hit_ratio": 0.5,
+        "evictions": 0,
+        "invalidations": 1,
+    }
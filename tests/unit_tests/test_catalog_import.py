@@ -0,0 +1,34 @@
+from src.schemas.catalog_schemas import CatalogRow
+from src.services.catalog_import import read_records
+
+
+def test_read_jsonl_records():
+    lines = [
+        '{"hotel_name": "Sea View", "room_name": "Double"}\n',
+        "\n",
+        "{not json}\n",
+        "[1, 2]\n",
+    ]
+
+    records = list(read_records(lines, "jsonl"))
+
+    assert records[0] == (1, {"hotel_name": "Sea View", "room_name": "Double"})
+    assert records[1][0] == 3 and records[1][1].startswith("invalid JSON")
+    assert records[2] == (4, "expected a JSON object")
+
+
+def test_read_csv_records():
+    lines = [
+        "hotel_name,hotel_location,room_name,description,price_per_night,quantity,facility_ids,amenity_ids\r\n",
+        "Sea View,Sochi,Double,,120,4,1;2,\r\n",
+        "Sea View,Sochi,Single,,90,2,,,extra\r\n",
+    ]
+
+    records = list(read_records(lines, "csv"))
+
+    assert records[1] == (3, "more cells than header columns")
+    row = CatalogRow.model_validate(records[0][1])
+    assert records[0][0] == 2
+    assert row.description is None
+    assert row.facility_ids == [1, 2]
+    assert row.amenity_ids == []
@@ -0,0 +1,33 @@
+from src.database import async_session_maker_null_pool
+from src.utils.db_manager import DBManager
+
+
+async def test_untouched_manager_opens_no_session():
+    calls = []
+
+    def session_factory():
+        calls.append(1)
+        return async_session_maker_null_pool()
+
+    async with DBManager(session_factory=session_factory) as db:
+        pass
+    assert not calls
+    assert "session" not in db.__dict__
+
+    async with DBManager(session_factory=session_factory) as db:
+        assert db.hotels.session is db.rooms.session is db.session
+        assert db.hotels is db.hotels
+    # Repositories were built, but no statement ran: no connection, no rollback
+    assert len(calls) == 1
+    assert not db.session.in_transaction()
+
+
+async def test_commit_pins_reads_to_primary():
+    async with DBManager(
+            session_factory=async_session_maker_null_pool,
+            read_session_factory=async_session_maker_null_pool,
+    ) as db:
+        assert db.hotels.reader is db.read_session
+        await db.commit()
+        assert db.hotels.reader is db.session
+        assert db.rooms.reader is db.session
@@ -0,0 +1,36 @@
+from collections import namedtuple
+from datetime import date
+
+from src.utils.export import export_chunks
+
+BookingRow = namedtuple("BookingRow", ["id", "room_id", "date_from"])
+
+
+async def batches(*batches):
+    for rows in batches:
+        yield rows
+
+
+async def collect(chunks) -> bytes:
+    return b"".join([chunk async for chunk in chunks])
+
+
+async def test_ndjson_export():
+    rows = [BookingRow(1, 10, date(2030, 1, 1)), BookingRow(2, 11, date(2030, 1, 2))]
+
+    body = await collect(export_chunks("ndjson", BookingRow._fields, batches(rows[:1], rows[1:])))
+
+    assert body == (
+        b'{"id":1,"room_id":10,"date_from":"2030-01-01"}\n'
+        b'{"id":2,"room_id":11,"date_from":"2030-01-02"}\n'
+    )
+
+
+async def test_csv_export():
+    rows = [BookingRow(1, 10, date(2030, 1, 1)), BookingRow(2, 11, date(2030, 1, 2))]
+
+    body = await collect(export_chunks("csv", BookingRow._fields, batches(rows[:1], rows[1:])))
+    empty = await collect(export_chunks("csv", BookingRow._fields, batches()))
+
+    assert body == b"id,room_id,date_from\r\n1,10,2030-01-01\r\n2,11,2030-01-02\r\n"
+    assert empty == b"id,room_id,date_from\r\n"
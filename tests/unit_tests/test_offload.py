@@ -0,0 +1,45 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.utils.offload import BoundedExecutor, QueueFull
+
+
+async def test_blocking_calls_leave_the_event_loop_free():
+    executor = BoundedExecutor(max_workers=2)
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    ticking = asyncio.create_task(ticker())
+    await asyncio.gather(*[executor.run(time.sleep, 0.1) for _ in range(4)])
+    ticking.cancel()
+
+    assert ticks >= 10
+    assert executor.completed == 4 and executor.queued == executor.running == 0
+    executor.shutdown()
+
+
+async def test_concurrency_limit_and_queue_depth():
+    executor = BoundedExecutor(max_workers=1, max_queue=1)
+    release = threading.Event()
+
+    first = asyncio.create_task(executor.run(release.wait))
+    second = asyncio.create_task(executor.run(release.wait))
+    await asyncio.sleep(0.05)
+
+    assert executor.running == 1
+    assert executor.queued == 1
+    with pytest.raises(QueueFull):
+        await executor.run(release.wait)
+    assert executor.rejected == 1
+
+    release.set()
+    assert await asyncio.gather(first, second) == [True, True]
+    executor.shutdown()
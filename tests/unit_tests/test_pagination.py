@@ -0,0 +1,12 @@
+import pytest
+
+from src.schemas.pagination import PaginationError, decode_cursor, encode_cursor
+
+
+def test_cursor_round_trip():
+    assert decode_cursor(encode_cursor(42), int) == 42
+
+
+def test_malformed_cursor_is_a_pagination_error():
+    with pytest.raises(PaginationError):
+        decode_cursor("not-a-cursor", int)
@@ -0,0 +1,25 @@
+from src.utils.pool_metrics import Histogram, InstrumentedPool, PoolMetrics, pool_metrics
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = Histogram((1, 10, 100))
+    for value in (0.5, 1, 7, 250):
+        histogram.observe(value)
+
+    assert histogram.snapshot() == {
+        "count": 4,
+        "sum": 258.5,
+        "avg": 64.625,
+        "buckets": {"1": 2, "10": 3, "100": 3, "+Inf": 4},
+    }
+
+
+def test_pools_report_to_their_own_metrics():
+    metrics = PoolMetrics()
+    pool_class = InstrumentedPool.with_metrics(metrics)
+    pool = pool_class(lambda: None, pool_size=3, max_overflow=2)
+
+    assert issubclass(pool_class, InstrumentedPool)
+    assert pool.metrics is metrics and InstrumentedPool.metrics is pool_metrics
+    assert pool.overflow_limit == 2
+    assert metrics.snapshot(pool)["size"] == 3
@@ -0,0 +1,71 @@
+import asyncio
+
+import pytest
+
+from src.connectors.redis_connector import RedisConnector
+from src.repo.rooms_repo import RoomsRepository
+from src.services.search import SearchService
+from src.services.search_cache import SearchCache
+from src.utils.db_manager import DBManager
+
+
+class FakeSession:
+    def __init__(self):
+        self.info = {}
+        self.closed = False
+
+    def in_transaction(self):
+        return False
+
+    async def close(self):
+        self.closed = True
+
+
+async def test_coalesced_search_survives_first_caller_cancelled(monkeypatch):
+    sessions = []
+    cache = SearchCache(RedisConnector(host="localhost", port=6379))
+
+    def session_factory():
+        sessions.append(FakeSession())
+        return sessions[-1]
+
+    async def search_rooms(repo, hotel_id, date_from=None, date_to=None):
+        await asyncio.sleep(0.05)
+        assert not repo.session.closed
+        return []
+
+    monkeypatch.setattr(RoomsRepository, "search_rooms", search_rooms)
+
+    async def request():
+        async with DBManager(session_factory=session_factory) as db:
+            return await SearchService(db, cache, track=False).search_rooms(hotel_id=1)
+
+    first = asyncio.create_task(request())
+    await asyncio.sleep(0)
+    second = asyncio.create_task(request())
+    await asyncio.sleep(0.01)
+    first.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+    assert await second == b"[]"
+    assert cache.single_flight.coalesced == 1
+    # One computation, in a session of its own, closed once it is done
+    assert len(sessions) == 1 and sessions[0].closed
+
+
+async def test_search_computations_read_from_primary(monkeypatch):
+    cache = SearchCache(RedisConnector(host="localhost", port=6379))
+    readers = []
+
+    async def search_rooms(repo, hotel_id, date_from=None, date_to=None):
+        readers.append((repo.reader, repo.session))
+        return []
+
+    monkeypatch.setattr(RoomsRepository, "search_rooms", search_rooms)
+
+    async with DBManager(session_factory=FakeSession, read_session_factory=FakeSession) as db:
+        assert await SearchService(db, cache, track=False).search_rooms(hotel_id=1) == b"[]"
+
+    [(reader, primary)] = readers
+    assert reader is primary
@@ -0,0 +1,45 @@
+import json
+from datetime import date
+
+from src.connectors.redis_connector import RedisConnector
+from src.services.search_cache import SearchCache
+
+
+def test_key_ignores_param_order_and_missing_filters():
+    cache = SearchCache(RedisConnector(host="localhost", port=6379))
+
+    key = cache.key("hotels_search", page=1, per_page=5, location="rome", date_from=date(2026, 1, 1))
+    same_key = cache.key("hotels_search", date_from=date(2026, 1, 1), name=None, per_page=5, location="rome", page=1)
+
+    assert key == same_key
+    assert key.startswith("search:hotels_search:")
+    assert key != cache.key("hotels_search", page=2, per_page=5, location="rome", date_from=date(2026, 1, 1))
+    assert key != cache.key("rooms_search", page=1, per_page=5, location="rome", date_from=date(2026, 1, 1))
+
+
+async def test_cache_without_redis_is_a_miss():
+    cache = SearchCache(RedisConnector(host="localhost", port=6379))
+    key = cache.key("hotels_search", page=1)
+
+    await cache.set(key, b"[]", ["hotels"])
+    await cache.invalidate("hotels")
+
+    assert await cache.get(key) is None
+
+
+def test_tracked_member_replays_to_the_same_key():
+    cache = SearchCache(RedisConnector(host="localhost", port=6379))
+    params = dict(page=1, per_page=5, after=None, location="rome", date_from=date(2026, 1, 1), fuzzy=False)
+
+    entry = json.loads(cache.member("hotels_search", **params))
+
+    assert entry["namespace"] == "hotels_search"
+    assert "after" not in entry["params"]
+    assert cache.key(entry["namespace"], **entry["params"]) == cache.key("hotels_search", **params)
+
+
+async def test_popular_searches_without_redis():
+    cache = SearchCache(RedisConnector(host="localhost", port=6379))
+
+    assert await cache.popular(10) == []
+    assert await cache.cached(["a", "b"]) == [False, False]
@@ -0,0 +1,28 @@
+import asyncio
+
+from src.utils.single_flight import SingleFlight, should_refresh_early
+
+
+async def test_concurrent_calls_share_one_computation():
+    single_flight = SingleFlight()
+    computations = 0
+
+    async def compute():
+        nonlocal computations
+        computations += 1
+        await asyncio.sleep(0.01)
+        return computations
+
+    results = await asyncio.gather(*[single_flight.do("key", compute) for _ in range(10)])
+
+    assert results == [1] * 10
+    assert computations == 1
+    assert single_flight.coalesced == 9
+    assert not single_flight.in_flight("key")
+    assert await single_flight.do("key", compute) == 2
+
+
+def test_early_refresh_probability():
+    assert not should_refresh_early(delta=0, ttl=0.001)
+    assert not any(should_refresh_early(delta=0.001, ttl=300) for _ in range(1000))
+    assert all(should_refresh_early(delta=10, ttl=0) for _ in range(1000))
@@ -0,0 +1,57 @@
+import time
+
+from src.connectors.redis_connector import RedisConnector
+from src.services.token_store import TokenRevocations
+from src.utils.bloom import BloomFilter
+from src.utils.rate_limit import SlidingWindowLimiter
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    added = [f"token-{n}".encode() for n in range(1000)]
+    for item in added:
+        bloom.add(item)
+
+    assert all(item in bloom for item in added)
+    false_positives = sum(f"other-{n}".encode() in bloom for n in range(10_000))
+    assert false_positives < 300
+    assert bloom.full
+
+
+async def test_revocations_without_redis_stay_local():
+    revocations = TokenRevocations(RedisConnector(host="localhost", port=6379))
+
+    await revocations.revoke("revoked", time.time() + 60)
+    await revocations.revoke("already-expired", time.time() - 1)
+
+    assert await revocations.is_revoked("revoked")
+    assert not await revocations.is_revoked("already-expired")
+    assert not await revocations.is_revoked("valid")
+    assert revocations.stats()["checks"] == 3
+
+
+async def test_rate_limiter_fails_open_without_redis():
+    limiter = SlidingWindowLimiter(RedisConnector(host="localhost", port=6379), "test", limit=1, window=60)
+
+    assert [await limiter.hit("key") for _ in range(3)] == [0, 0, 0]
+
+
+class FakeScanRedis:
+    def __init__(self, keys: list[bytes]):
+        self.keys = keys
+
+    async def scan_iter(self, match: str):
+        for key in self.keys:
+            yield key
+
+
+async def test_rebuild_sizes_the_filter_for_live_revocations():
+    connector = RedisConnector(host="localhost", port=6379)
+    revocations = TokenRevocations(connector, capacity=10)
+    connector.redis = FakeScanRedis([b"auth:revoked:%d" % n for n in range(50)])
+
+    await revocations.rebuild()
+
+    assert all(b"%d" % n in revocations._bloom for n in range(50))
+    assert not revocations._bloom.full
+    assert revocations.stats()["bloom_capacity"] == 100
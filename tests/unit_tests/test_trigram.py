@@ -0,0 +1,21 @@
+from types import SimpleNamespace
+
+from src.utils.trigram import rank_hotels, similarity, trigrams, word_similarity
+
+
+def test_matches_pg_trgm_reference_values():
+    # Reference values from the pg_trgm documentation.
+    assert trigrams("word") == {"  w", " wo", "wor", "ord", "rd "}
+    assert round(similarity("word", "two words"), 6) == 0.363636
+    assert word_similarity("word", "two words") == 0.8
+
+
+def test_rank_hotels_tolerates_typos():
+    hotels = [
+        SimpleNamespace(id=1, name="The Plaza", location="New York"),
+        SimpleNamespace(id=2, name="Plaza Athenee", location="Paris"),
+        SimpleNamespace(id=3, name="The Drake", location="Chicago"),
+    ]
+
+    assert [hotel.id for hotel in rank_hotels(hotels, name="plazza")] == [1, 2]
+    assert [hotel.id for hotel in rank_hotels(hotels, name="plazza", location="new yrk")] == [1]